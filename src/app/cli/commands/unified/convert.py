@@ -61,7 +61,7 @@ class ConvertCommand(BaseCommand):
         """Delegate to RDF/JSON-LD conversion logic."""
         from src.rdf import (
             InputValidator,
-            parse_ttl_with_result,
+            parse_ttl_file_with_result,
             parse_ttl_streaming,
             StreamingRDFConverter,
             RDFGraphParser,
@@ -110,13 +110,11 @@ class ConvertCommand(BaseCommand):
                     rdf_format=format_hint,
                 )
             else:
-                with open(validated_path, 'r', encoding='utf-8') as f:
-                    ttl_content = f.read()
-                definition, ontology_name, conversion_result = parse_ttl_with_result(
-                    ttl_content,
+                # The path goes to rdflib, which reads the file incrementally
+                definition, ontology_name, conversion_result = parse_ttl_file_with_result(
+                    str(validated_path),
                     force_large_file=force_memory,
                     rdf_format=format_hint,
-                    source_path=str(validated_path),
                 )
         except ValueError as e:
             print(f"✗ Invalid RDF content: {e}")
@@ -160,7 +158,7 @@ class ConvertCommand(BaseCommand):
         extensions: Optional[List[str]] = None,
     ) -> int:
         """Convert all RDF/JSON-LD files in a directory."""
-        from src.rdf import InputValidator, parse_ttl_with_result, RDFGraphParser
+        from src.rdf import InputValidator, parse_ttl_file_with_result, RDFGraphParser
         
         ext_list = extensions or getattr(InputValidator, 'TTL_EXTENSIONS', ['.ttl'])
         files = set()
@@ -184,13 +182,10 @@ class ConvertCommand(BaseCommand):
             print(f"[{i}/{len(files)}] {f.name}")
             try:
                 validated_path = InputValidator.validate_input_ttl_path(str(f))
-                with open(validated_path, 'r', encoding='utf-8') as fp:
-                    content = fp.read()
                 format_hint = rdf_format_override or RDFGraphParser.infer_format_from_path(validated_path)
-                definition, ontology_name, conversion_result = parse_ttl_with_result(
-                    content,
+                definition, ontology_name, conversion_result = parse_ttl_file_with_result(
+                    str(validated_path),
                     rdf_format=format_hint,
-                    source_path=str(validated_path),
                 )
                 output = {
                     "displayName": ontology_name,
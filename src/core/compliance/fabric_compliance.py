@@ -5,6 +5,7 @@ Validates ontologies against Microsoft Fabric API limits.
 """
 
 import logging
+from operator import attrgetter
 from typing import Any, Dict, List, Optional, TYPE_CHECKING
 
 from .models import (
@@ -18,6 +19,8 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_get_id = attrgetter("id")
+
 
 # Fabric API limits
 FABRIC_LIMITS = {
@@ -94,7 +97,7 @@ class FabricComplianceChecker:
             }
         )
         
-        entity_ids = {e.id for e in entity_types}
+        entity_ids = set(map(_get_id, entity_types))
         
         for entity in entity_types:
             # Check name length
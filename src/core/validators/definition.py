@@ -10,12 +10,15 @@ separation of concerns and reusability across RDF/DTDL converters.
 
 import logging
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from operator import attrgetter
+from typing import AbstractSet, Any, Dict, FrozenSet, Iterator, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+_get_id = attrgetter("id")
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class DefinitionValidationError:
     """Represents a validation error in the ontology definition."""
     level: str  # "error" or "warning"
@@ -54,7 +57,29 @@ class FabricDefinitionValidator:
     """
     
     @staticmethod
-    def validate_entity_types(entity_types: List) -> List[DefinitionValidationError]:
+    def _build_entity_ids(entity_types: List) -> FrozenSet[str]:
+        """Build the set of entity type IDs used for reference checks."""
+        return frozenset(map(_get_id, entity_types))
+    
+    @staticmethod
+    def _build_property_index(entity_types: List) -> Dict[str, Dict[str, Any]]:
+        """
+        Build a per-entity index of property id -> property.
+        
+        Properties are inserted in reverse so the first property with a
+        given id wins, matching a front-to-back linear search.
+        """
+        return {
+            e.id: {p.id: p for p in reversed(e.properties)}
+            for e in entity_types
+        }
+    
+    @staticmethod
+    def validate_entity_types(
+        entity_types: List,
+        entity_ids: Optional[AbstractSet[str]] = None,
+        props_by_entity: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> List[DefinitionValidationError]:
         """
         Validate entity type definitions.
         
@@ -68,103 +93,106 @@ class FabricDefinitionValidator:
         
         Args:
             entity_types: List of entity types to validate
+            entity_ids: Optional prebuilt set of entity IDs
+            props_by_entity: Optional prebuilt property index
+                (see _build_property_index)
             
         Returns:
             List of validation errors (may include warnings)
         """
-        errors: List[DefinitionValidationError] = []
-        
-        # Build ID set for validation
-        id_set = {e.id for e in entity_types}
-        prop_ids_by_entity = {
-            e.id: {p.id for p in e.properties} 
-            for e in entity_types
-        }
+        # Build lookup tables unless the caller already has them
+        if entity_ids is None:
+            entity_ids = FabricDefinitionValidator._build_entity_ids(entity_types)
+        if props_by_entity is None:
+            props_by_entity = FabricDefinitionValidator._build_property_index(entity_types)
         
+        return list(FabricDefinitionValidator._iter_entity_type_issues(
+            entity_types, entity_ids, props_by_entity
+        ))
+    
+    @staticmethod
+    def _iter_entity_type_issues(
+        entity_types: List,
+        entity_ids: AbstractSet[str],
+        props_by_entity: Dict[str, Dict[str, Any]],
+    ) -> Iterator[DefinitionValidationError]:
+        """Yield entity type issues in order (see validate_entity_types)."""
         for entity in entity_types:
             # 1. Validate parent reference
             if entity.baseEntityTypeId:
-                if entity.baseEntityTypeId not in id_set:
-                    errors.append(DefinitionValidationError(
+                if entity.baseEntityTypeId not in entity_ids:
+                    yield DefinitionValidationError(
                         level="error",
                         message=(
                             f"Entity '{entity.name}' references non-existent parent "
                             f"'{entity.baseEntityTypeId}'"
                         ),
                         entity_id=entity.id
-                    ))
+                    )
                 elif entity.baseEntityTypeId == entity.id:
                     # Self-reference
-                    errors.append(DefinitionValidationError(
+                    yield DefinitionValidationError(
                         level="error",
                         message=f"Entity '{entity.name}' cannot inherit from itself",
                         entity_id=entity.id
-                    ))
+                    )
+            
+            # Property lookups below share one per-entity index
+            props = props_by_entity.get(entity.id, {})
             
             # 2. Validate displayNamePropertyId exists
             if entity.displayNamePropertyId:
-                prop_ids = prop_ids_by_entity.get(entity.id, set())
-                if entity.displayNamePropertyId not in prop_ids:
-                    errors.append(DefinitionValidationError(
+                prop = props.get(entity.displayNamePropertyId)
+                if prop is None:
+                    yield DefinitionValidationError(
                         level="error",
                         message=(
                             f"Entity '{entity.name}' displayNamePropertyId "
                             f"'{entity.displayNamePropertyId}' not found in properties"
                         ),
                         entity_id=entity.id
-                    ))
-                else:
+                    )
+                elif prop.valueType != "String":
                     # Validate it's a String property (Fabric requirement)
-                    prop = next(
-                        (p for p in entity.properties 
-                         if p.id == entity.displayNamePropertyId),
-                        None
+                    yield DefinitionValidationError(
+                        level="warning",
+                        message=(
+                            f"Entity '{entity.name}' displayNameProperty "
+                            f"should be String type, got '{prop.valueType}'"
+                        ),
+                        entity_id=entity.id
                     )
-                    if prop and prop.valueType != "String":
-                        errors.append(DefinitionValidationError(
-                            level="warning",
-                            message=(
-                                f"Entity '{entity.name}' displayNameProperty "
-                                f"should be String type, got '{prop.valueType}'"
-                            ),
-                            entity_id=entity.id
-                        ))
             
             # 3. Validate entityIdParts
             if entity.entityIdParts:
-                prop_ids = prop_ids_by_entity.get(entity.id, set())
-                for part_id in entity.entityIdParts:
-                    if part_id not in prop_ids:
-                        errors.append(DefinitionValidationError(
+                # A part listed twice would repeat the same issue; check each once
+                for part_id in dict.fromkeys(entity.entityIdParts):
+                    prop = props.get(part_id)
+                    if prop is None:
+                        yield DefinitionValidationError(
                             level="error",
                             message=(
                                 f"Entity '{entity.name}' entityIdPart "
                                 f"'{part_id}' not found in properties"
                             ),
                             entity_id=entity.id
-                        ))
-                    else:
+                        )
+                    elif prop.valueType not in ("String", "BigInt"):
                         # Validate type is String or BigInt (Fabric requirement)
-                        prop = next(
-                            (p for p in entity.properties if p.id == part_id),
-                            None
+                        yield DefinitionValidationError(
+                            level="warning",
+                            message=(
+                                f"Entity '{entity.name}' entityIdPart '{part_id}' should be "
+                                f"String or BigInt, got '{prop.valueType}'"
+                            ),
+                            entity_id=entity.id
                         )
-                        if prop and prop.valueType not in ("String", "BigInt"):
-                            errors.append(DefinitionValidationError(
-                                level="warning",
-                                message=(
-                                    f"Entity '{entity.name}' entityIdPart '{part_id}' should be "
-                                    f"String or BigInt, got '{prop.valueType}'"
-                                ),
-                                entity_id=entity.id
-                            ))
-        
-        return errors
     
     @staticmethod
     def validate_relationships(
         relationship_types: List,
-        entity_types: List
+        entity_types: List,
+        entity_ids: Optional[AbstractSet[str]] = None,
     ) -> List[DefinitionValidationError]:
         """
         Validate relationship definitions.
@@ -177,58 +205,69 @@ class FabricDefinitionValidator:
         Args:
             relationship_types: List of relationships to validate
             entity_types: List of entity types for reference checking
+            entity_ids: Optional prebuilt set of entity IDs
             
         Returns:
             List of validation errors (may include warnings)
         """
-        errors: List[DefinitionValidationError] = []
-        
-        entity_ids = {e.id for e in entity_types}
+        if entity_ids is None:
+            entity_ids = FabricDefinitionValidator._build_entity_ids(entity_types)
         
+        return list(FabricDefinitionValidator._iter_relationship_issues(
+            relationship_types, entity_ids
+        ))
+    
+    @staticmethod
+    def _iter_relationship_issues(
+        relationship_types: List,
+        entity_ids: AbstractSet[str],
+    ) -> Iterator[DefinitionValidationError]:
+        """Yield relationship issues in order (see validate_relationships)."""
         for rel in relationship_types:
             source_id = rel.source.entityTypeId
             target_id = rel.target.entityTypeId
+            # Looked up once; the self-relationship check reuses it
+            source_known = source_id in entity_ids
             
             # Validate source exists
-            if source_id not in entity_ids:
-                errors.append(DefinitionValidationError(
+            if not source_known:
+                yield DefinitionValidationError(
                     level="error",
                     message=(
                         f"Relationship '{rel.name}' source '{source_id}' "
                         f"references non-existent entity type"
                     ),
                     entity_id=rel.id
-                ))
+                )
             
             # Validate target exists
             if target_id not in entity_ids:
-                errors.append(DefinitionValidationError(
+                yield DefinitionValidationError(
                     level="error",
                     message=(
                         f"Relationship '{rel.name}' target '{target_id}' "
                         f"references non-existent entity type"
                     ),
                     entity_id=rel.id
-                ))
+                )
             
             # Warn on self-relationships (unusual but allowed)
-            if source_id == target_id and source_id in entity_ids:
-                errors.append(DefinitionValidationError(
+            if source_known and source_id == target_id:
+                yield DefinitionValidationError(
                     level="warning",
                     message=(
                         f"Relationship '{rel.name}' is self-referential "
                         f"(source and target are same entity)"
                     ),
                     entity_id=rel.id
-                ))
-        
-        return errors
+                )
     
     @classmethod
     def validate_definition(
         cls,
         entity_types: List,
-        relationship_types: List
+        relationship_types: List,
+        fail_fast: bool = False,
     ) -> Tuple[bool, List[DefinitionValidationError]]:
         """
         Validate complete ontology definition.
@@ -236,20 +275,49 @@ class FabricDefinitionValidator:
         Args:
             entity_types: List of entity types
             relationship_types: List of relationship types
+            fail_fast: If True, stop at the first "error" level issue and
+                return only that issue (for callers that only need is_valid)
             
         Returns:
             Tuple of (is_valid: bool, errors: List[DefinitionValidationError])
             is_valid is True only if there are no "error" level issues
         """
-        all_errors: List[DefinitionValidationError] = []
-        
-        # Run all validations
-        all_errors.extend(cls.validate_entity_types(entity_types))
-        all_errors.extend(cls.validate_relationships(relationship_types, entity_types))
+        issues = cls.validate_definition_iter(entity_types, relationship_types)
+        if fail_fast:
+            first_error = next((e for e in issues if e.level == "error"), None)
+            if first_error is not None:
+                return False, [first_error]
+            return True, []
         
-        # Separate errors from warnings
-        critical_errors = [e for e in all_errors if e.level == "error"]
+        all_errors = list(issues)
         
-        is_valid = len(critical_errors) == 0
+        is_valid = not any(e.level == "error" for e in all_errors)
         
         return is_valid, all_errors
+    
+    @classmethod
+    def validate_definition_iter(
+        cls,
+        entity_types: List,
+        relationship_types: List
+    ) -> Iterator[DefinitionValidationError]:
+        """
+        Lazily validate a complete ontology definition.
+        
+        Yields the same issues, in the same order, as validate_definition.
+        Callers that stop early (e.g. at the first error) skip the rest
+        of the scan.
+        
+        Args:
+            entity_types: List of entity types
+            relationship_types: List of relationship types
+            
+        Yields:
+            DefinitionValidationError for each error or warning found
+        """
+        # Build shared lookup tables once for both validators
+        entity_ids = cls._build_entity_ids(entity_types)
+        props_by_entity = cls._build_property_index(entity_types)
+        
+        yield from cls._iter_entity_type_issues(entity_types, entity_ids, props_by_entity)
+        yield from cls._iter_relationship_issues(relationship_types, entity_ids)
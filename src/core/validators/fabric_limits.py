@@ -12,7 +12,7 @@ from typing import Any, Dict, List, Optional
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class FabricLimitValidationError:
     """
     Represents a validation error or warning for Fabric API limits.
@@ -362,7 +362,7 @@ class FabricLimitsValidator:
                 ))
                 
         except Exception as e:
-            self._logger.warning(f"Could not estimate definition size: {e}")
+            self._logger.warning("Could not estimate definition size: %s", e)
         
         return errors
     
@@ -562,7 +562,7 @@ class EntityIdPartsInferrer:
             if prop_id:
                 result.append(prop_id)
             else:
-                self._logger.warning(f"Property '{name}' not found for entityIdParts mapping")
+                self._logger.warning("Property '%s' not found for entityIdParts mapping", name)
         
         return result
     
@@ -592,7 +592,7 @@ class EntityIdPartsInferrer:
                 updated += 1
                 
                 entity_name = getattr(entity, 'name', 'Unknown')
-                self._logger.debug(f"Set entityIdParts for '{entity_name}': {inferred_parts}")
+                self._logger.debug("Set entityIdParts for '%s': %s", entity_name, inferred_parts)
         
         return updated
     
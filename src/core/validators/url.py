@@ -132,7 +132,7 @@ class URLValidator:
                     return True
         except socket.gaierror:
             # DNS resolution failed - treat as potentially unsafe
-            logger.warning(f"Could not resolve hostname: {hostname}")
+            logger.warning("Could not resolve hostname: %s", hostname)
             pass
         
         return False
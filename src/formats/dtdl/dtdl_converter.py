@@ -46,6 +46,7 @@ from src.shared.models import (
     ConversionResult,
     SkippedItem,
 )
+from src.shared.utilities.naming import INVALID_NAME_CHARS as _INVALID_NAME_CHARS
 from src.core.validators import (
     FabricLimitsValidator,
     EntityIdPartsInferrer,
@@ -1093,7 +1094,7 @@ class DTDLToFabricConverter:
             return "Entity"
         
         # Replace invalid characters with underscore
-        sanitized = ''.join(c if c.isalnum() or c == '_' else '_' for c in name)
+        sanitized = _INVALID_NAME_CHARS.sub('_', name)
         
         # Ensure starts with letter
         if not sanitized[0].isalpha():
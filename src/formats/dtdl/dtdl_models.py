@@ -750,7 +750,10 @@ class DTDLInterface:
             if isinstance(self.display_name, str):
                 return self.display_name
             # Return English or first available language
-            return self.display_name.get("en", list(self.display_name.values())[0])
+            english = self.display_name.get("en")
+            if english is not None:
+                return english
+            return next(iter(self.display_name.values()))
         return self.name
     
     def to_dict(self) -> Dict[str, Any]:
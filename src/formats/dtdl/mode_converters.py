@@ -23,6 +23,7 @@ from src.shared.models import (
     RelationshipType,
     RelationshipEnd,
 )
+from src.shared.utilities.naming import INVALID_NAME_CHARS as _INVALID_NAME_CHARS
 
 logger = logging.getLogger(__name__)
 
@@ -124,7 +125,7 @@ class ComponentConverter:
         """Default name sanitization."""
         if not name:
             return "Entity"
-        sanitized = ''.join(c if c.isalnum() or c == '_' else '_' for c in name)
+        sanitized = _INVALID_NAME_CHARS.sub('_', name)
         if not sanitized[0].isalpha():
             sanitized = 'E_' + sanitized
         return sanitized[:90]
@@ -308,7 +309,7 @@ class CommandConverter:
         """Default name sanitization."""
         if not name:
             return "Entity"
-        sanitized = ''.join(c if c.isalnum() or c == '_' else '_' for c in name)
+        sanitized = _INVALID_NAME_CHARS.sub('_', name)
         if not sanitized[0].isalpha():
             sanitized = 'E_' + sanitized
         return sanitized[:90]
@@ -511,7 +512,7 @@ class ScaledDecimalConverter:
         """Default name sanitization."""
         if not name:
             return "property"
-        sanitized = ''.join(c if c.isalnum() or c == '_' else '_' for c in name)
+        sanitized = _INVALID_NAME_CHARS.sub('_', name)
         if not sanitized[0].isalpha():
             sanitized = 'p_' + sanitized
         return sanitized[:90]
@@ -17,7 +17,7 @@ Components:
 - property_extractor: Class/property extraction from RDF graphs
 """
 
-from .type_mapper import TypeMapper, XSD_TO_FABRIC_TYPE
+from .type_mapper import TypeMapper, XSD_PREFIX, XSD_TO_FABRIC_TYPE
 from .uri_utils import URIUtils
 from .class_resolver import ClassResolver
 from .fabric_serializer import FabricSerializer
@@ -27,6 +27,9 @@ from .property_extractor import (
     DataPropertyExtractor,
     ObjectPropertyExtractor,
     EntityIdentifierSetter,
+    classify_rdf_properties,
+    GraphIndex,
+    RelationshipKey,
 )
 from .streaming_converter import StreamingRDFConverter
 from .rdf_converter import (
@@ -39,7 +42,10 @@ from .rdf_converter import (
     parse_ttl_file_with_result,
     parse_ttl_with_result,
     parse_ttl_streaming,
+    parse_ttl_files,
     convert_to_fabric_definition,
+    convert_to_fabric_definition_stream,
+    ConversionCache,
     # Re-export models for convenience
     EntityType,
     EntityTypeProperty,
@@ -79,7 +85,10 @@ __all__ = [
     'parse_ttl_file_with_result',
     'parse_ttl_with_result',
     'parse_ttl_streaming',
+    'parse_ttl_files',
     'convert_to_fabric_definition',
+    'convert_to_fabric_definition_stream',
+    'ConversionCache',
     # Validation
     'PreflightValidator',
     'ValidationReport',
@@ -104,6 +113,7 @@ __all__ = [
     'SkippedItem',
     # Helper components
     'TypeMapper',
+    'XSD_PREFIX',
     'XSD_TO_FABRIC_TYPE', 
     'URIUtils',
     'ClassResolver',
@@ -114,4 +124,7 @@ __all__ = [
     'DataPropertyExtractor',
     'ObjectPropertyExtractor',
     'EntityIdentifierSetter',
+    'classify_rdf_properties',
+    'GraphIndex',
+    'RelationshipKey',
 ]
@@ -12,7 +12,7 @@ Extracted from RDFToFabricConverter for Single Responsibility Principle.
 """
 
 import logging
-from typing import List, Optional, Set, Tuple, Union
+from typing import Iterator, List, Optional, Set, Tuple, Union
 from rdflib import Graph, RDF, OWL, URIRef, BNode
 from rdflib.term import Node
 
@@ -76,12 +76,12 @@ class ClassResolver:
         
         # Cycle detection - skip if we've seen this node
         if node in visited:
-            logger.debug(f"Cycle detected in class resolution, skipping node: {node}")
+            logger.debug("Cycle detected in class resolution, skipping node: %s", node)
             return targets
         
         # Depth limit check
         if max_depth <= 0:
-            logger.warning(f"Maximum recursion depth reached in class resolution for node: {node}")
+            logger.warning("Maximum recursion depth reached in class resolution for node: %s", node)
             return targets
         
         # Track this node as visited (only for BNodes which can cause cycles)
@@ -128,7 +128,7 @@ class ClassResolver:
                 unresolved_count += unresolved
             
             if unresolved_count > 0:
-                logger.debug(f"BNode resolution had {unresolved_count} unresolved items")
+                logger.debug("BNode resolution had %d unresolved items", unresolved_count)
         
         return targets
     
@@ -154,59 +154,80 @@ class ClassResolver:
         Returns:
             Tuple of (list of URI strings, count of unresolved items)
         """
-        if visited is None:
-            visited = set()
+        # One private copy per list; cells are added to it in place as the
+        # list is walked, and nested resolution copies it on entry.
+        seen: Set[Union[URIRef, BNode]] = set(visited) if visited else set()
         
         targets: List[str] = []
         unresolved_count = 0
+        
+        for first_node in cls._iter_rdf_list(graph, list_node, seen):
+            if isinstance(first_node, URIRef):
+                targets.append(str(first_node))
+            elif isinstance(first_node, BNode):
+                # Recursively resolve nested structures
+                nested_targets = cls.resolve_class_targets(
+                    graph, first_node, seen, max_depth - 1
+                )
+                if nested_targets:
+                    targets.extend(nested_targets)
+                else:
+                    unresolved_count += 1
+            else:
+                # Literal or unknown type
+                unresolved_count += 1
+        
+        return targets, unresolved_count
+    
+    @staticmethod
+    def _iter_rdf_list(
+        graph: Graph,
+        list_node: ListNode,
+        seen: Set[Union[URIRef, BNode]],
+        max_iterations: int = 1000,
+    ) -> Iterator[Node]:
+        """
+        Iterate the rdf:first values of an RDF list.
+        
+        Walks rdf:rest iteratively, stopping at rdf:nil, at a blank-node
+        cell already in ``seen`` (cycle), or after max_iterations cells.
+        Visited blank-node cells are added to ``seen`` in place.
+        
+        Args:
+            graph: The RDF graph to query
+            list_node: The head of the RDF list
+            seen: Mutable set of visited nodes, updated during iteration
+            max_iterations: Safety limit for malformed lists
+            
+        Yields:
+            Each rdf:first value that is present
+        """
         current = list_node
         iterations = 0
-        max_iterations = 1000  # Safety limit for malformed lists
         
         while current is not None and current != RDF.nil:
             iterations += 1
             if iterations > max_iterations:
-                logger.warning(f"RDF list exceeded maximum iterations ({max_iterations}), stopping")
+                logger.warning("RDF list exceeded maximum iterations (%d), stopping", max_iterations)
                 break
             
             # Cycle detection for list nodes
-            if isinstance(current, BNode) and current in visited:
-                logger.debug(f"Cycle detected in RDF list at node: {current}")
-                break
-            
             if isinstance(current, BNode):
-                visited = visited | {current}
+                if current in seen:
+                    logger.debug("Cycle detected in RDF list at node: %s", current)
+                    break
+                seen.add(current)
             
-            # Get the first element
             first_node = graph.value(current, RDF.first)
-            
             if first_node is not None:
-                if isinstance(first_node, URIRef):
-                    targets.append(str(first_node))
-                elif isinstance(first_node, BNode):
-                    # Recursively resolve nested structures
-                    nested_targets = cls.resolve_class_targets(
-                        graph, first_node, visited, max_depth - 1
-                    )
-                    if nested_targets:
-                        targets.extend(nested_targets)
-                    else:
-                        unresolved_count += 1
-                else:
-                    # Literal or unknown type
-                    unresolved_count += 1
+                yield first_node
             
             # Move to next element
             rest_node = graph.value(current, RDF.rest)
-            
-            if rest_node is None or rest_node == RDF.nil:
-                current = None
-            elif isinstance(rest_node, (URIRef, BNode)):
+            if isinstance(rest_node, (URIRef, BNode)) and rest_node != RDF.nil:
                 current = rest_node
             else:
-                current = None  # Unexpected type, end iteration
-        
-        return targets, unresolved_count
+                current = None  # End of list or unexpected type
     
     @classmethod
     def get_first_class(
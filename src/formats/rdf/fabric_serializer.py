@@ -10,13 +10,133 @@ Extracted from rdf_converter.py for Single Responsibility Principle.
 import base64
 import json
 import logging
-from typing import Dict, List, Any, TYPE_CHECKING
+from collections import defaultdict, deque
+from functools import lru_cache
+from typing import BinaryIO, Dict, Iterator, List, Any, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..rdf_converter import EntityType, RelationshipType
 
 logger = logging.getLogger(__name__)
 
+# Optional fast JSON encoder
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps_fast(obj: Any) -> bytes:
+    """
+    Serialize obj to indented UTF-8 JSON bytes.
+    
+    Uses orjson when it is installed and falls back to the standard
+    library otherwise. Both produce equivalent JSON with 2-space
+    indentation; the stdlib fallback escapes non-ASCII characters.
+    
+    Args:
+        obj: JSON-serializable data
+        
+    Returns:
+        Encoded JSON document
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+
+def dumps_compact(obj: Any) -> bytes:
+    """
+    Serialize obj to compact UTF-8 JSON bytes (no indentation).
+    
+    Args:
+        obj: JSON-serializable data
+        
+    Returns:
+        Encoded JSON document
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def dumps_line(obj: Any) -> bytes:
+    """
+    Serialize obj to one line of compact UTF-8 JSON, newline-terminated.
+    
+    Args:
+        obj: JSON-serializable data
+        
+    Returns:
+        Encoded JSON line (NDJSON record)
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return dumps_compact(obj) + b"\n"
+
+
+# Inheritance links as (entity id, baseEntityTypeId) pairs, in input order
+EntityLinks = Tuple[Tuple[str, Optional[str]], ...]
+
+# Lists smaller than this are sorted directly; caching only pays off once
+# the sort itself costs more than building the cache key
+SORT_CACHE_MIN_ENTITIES = 100
+
+
+def _topological_order(links: EntityLinks) -> Tuple[int, ...]:
+    """
+    Order entity positions so parents come before children (Kahn's algorithm).
+    
+    Args:
+        links: (entity id, baseEntityTypeId) for each entity, in input order
+        
+    Returns:
+        Input positions in sorted order; entities on an inheritance cycle
+        are appended at the end
+    """
+    position = {entity_id: i for i, (entity_id, _) in enumerate(links)}
+    
+    # Each entity has at most one in-scope parent, so its in-degree is 0 or 1
+    in_degree = [0] * len(links)
+    # Only parents get an entry; defaultdict avoids setdefault's throwaway
+    # list per child
+    children: Dict[int, List[int]] = defaultdict(list)
+    for i, (_, parent_id) in enumerate(links):
+        parent = position.get(parent_id) if parent_id else None
+        if parent is not None:
+            in_degree[i] = 1
+            children[parent].append(i)
+    
+    # Start with root entities (no parent), in input order
+    queue = deque(i for i, degree in enumerate(in_degree) if degree == 0)
+    order: List[int] = []
+    
+    while queue:
+        current = queue.popleft()
+        order.append(current)
+        
+        # get() so leaves do not add empty entries
+        for child in children.get(current, ()):
+            in_degree[child] -= 1
+            if in_degree[child] == 0:
+                queue.append(child)
+    
+    # Entities on an inheritance cycle are never released; keep them
+    # at the end rather than dropping them
+    if len(order) != len(links):
+        for i, degree in enumerate(in_degree):
+            if degree > 0:
+                logger.warning("Entity %s not reached in topological sort", links[i][0])
+                order.append(i)
+    
+    return tuple(order)
+
+
+# The order depends only on the id/parent links, so identical hierarchies
+# serialized more than once reuse the previous result
+_cached_topological_order = lru_cache(maxsize=8)(_topological_order)
+
 
 class FabricSerializer:
     """
@@ -46,26 +166,73 @@ class FabricSerializer:
         Returns:
             Dictionary with "parts" array for Fabric API
         """
-        parts = []
+        return {"parts": list(FabricSerializer.iter_definition_parts(
+            entity_types, relationship_types, ontology_name
+        ))}
+    
+    @staticmethod
+    def iter_definition_parts(
+        entity_types: List['EntityType'],
+        relationship_types: List['RelationshipType'],
+        ontology_name: str = "ImportedOntology"
+    ) -> Iterator[Dict[str, str]]:
+        """
+        Yield the definition parts one at a time, in create_definition order.
         
+        Args:
+            entity_types: List of entity types to include
+            relationship_types: List of relationship types to include
+            ontology_name: Display name for the ontology
+            
+        Yields:
+            Part dictionaries (path, payload, payloadType)
+        """
         # Add .platform file
-        parts.append(FabricSerializer._create_platform_part(ontology_name))
+        yield FabricSerializer._create_platform_part(ontology_name)
         
         # Add definition.json (empty for Fabric)
-        parts.append(FabricSerializer._create_definition_part())
+        yield FabricSerializer._create_definition_part()
         
         # Sort entity types so parents come before children (required by Fabric)
         sorted_entity_types = FabricSerializer._topological_sort_entities(entity_types)
         
         # Add entity type definitions
         for entity_type in sorted_entity_types:
-            parts.append(FabricSerializer._create_entity_part(entity_type))
+            yield FabricSerializer._create_entity_part(entity_type)
         
         # Add relationship type definitions
         for rel_type in relationship_types:
-            parts.append(FabricSerializer._create_relationship_part(rel_type))
+            yield FabricSerializer._create_relationship_part(rel_type)
+    
+    @staticmethod
+    def write_definition_parts(
+        entity_types: List['EntityType'],
+        relationship_types: List['RelationshipType'],
+        out_file: BinaryIO,
+        ontology_name: str = "ImportedOntology"
+    ) -> int:
+        """
+        Write the definition parts to a binary file as NDJSON.
+        
+        Each part is encoded and written as soon as it is built, so the
+        full parts list is never held in memory.
         
-        return {"parts": parts}
+        Args:
+            entity_types: List of entity types to include
+            relationship_types: List of relationship types to include
+            out_file: Binary file-like object to write JSON lines to
+            ontology_name: Display name for the ontology
+            
+        Returns:
+            Number of parts written
+        """
+        count = 0
+        for part in FabricSerializer.iter_definition_parts(
+            entity_types, relationship_types, ontology_name
+        ):
+            out_file.write(dumps_line(part))
+            count += 1
+        return count
     
     @staticmethod
     def _create_platform_part(ontology_name: str) -> Dict[str, str]:
@@ -78,9 +245,7 @@ class FabricSerializer:
         }
         return {
             "path": ".platform",
-            "payload": base64.b64encode(
-                json.dumps(platform_content, indent=2).encode()
-            ).decode(),
+            "payload": base64.b64encode(dumps_fast(platform_content)).decode(),
             "payloadType": "InlineBase64"
         }
     
@@ -99,9 +264,7 @@ class FabricSerializer:
         entity_content = entity_type.to_dict()
         return {
             "path": f"EntityTypes/{entity_type.id}/definition.json",
-            "payload": base64.b64encode(
-                json.dumps(entity_content, indent=2).encode()
-            ).decode(),
+            "payload": base64.b64encode(dumps_fast(entity_content)).decode(),
             "payloadType": "InlineBase64"
         }
     
@@ -111,9 +274,7 @@ class FabricSerializer:
         rel_content = rel_type.to_dict()
         return {
             "path": f"RelationshipTypes/{rel_type.id}/definition.json",
-            "payload": base64.b64encode(
-                json.dumps(rel_content, indent=2).encode()
-            ).decode(),
+            "payload": base64.b64encode(dumps_fast(rel_content)).decode(),
             "payloadType": "InlineBase64"
         }
     
@@ -133,42 +294,12 @@ class FabricSerializer:
         Returns:
             Sorted list with parents before children
         """
-        # Build adjacency map (child -> parent)
-        id_to_entity = {e.id: e for e in entity_types}
-        
-        # Kahn's algorithm for topological sort
-        in_degree: Dict[str, int] = {e.id: 0 for e in entity_types}
-        children: Dict[str, List[str]] = {e.id: [] for e in entity_types}
-        
-        for entity in entity_types:
-            if entity.baseEntityTypeId and entity.baseEntityTypeId in id_to_entity:
-                in_degree[entity.id] += 1
-                children[entity.baseEntityTypeId].append(entity.id)
-        
-        # Start with root entities (no parent)
-        queue = [e.id for e in entity_types if in_degree[e.id] == 0]
-        sorted_entities: List['EntityType'] = []
-        visited: set = set()
-        
-        while queue:
-            current_id = queue.pop(0)
-            if current_id in visited:
-                continue
-            visited.add(current_id)
-            sorted_entities.append(id_to_entity[current_id])
-            
-            for child_id in children.get(current_id, []):
-                in_degree[child_id] -= 1
-                if in_degree[child_id] == 0:
-                    queue.append(child_id)
-        
-        # Add any remaining entities (shouldn't happen if graph is well-formed)
-        for entity in entity_types:
-            if entity.id not in visited:
-                logger.warning(f"Entity {entity.id} not reached in topological sort")
-                sorted_entities.append(entity)
-        
-        return sorted_entities
+        links: EntityLinks = tuple((e.id, e.baseEntityTypeId) for e in entity_types)
+        if len(links) < SORT_CACHE_MIN_ENTITIES:
+            order = _topological_order(links)
+        else:
+            order = _cached_topological_order(links)
+        return [entity_types[i] for i in order]
     
     @staticmethod
     def encode_payload(data: Any) -> str:
@@ -181,8 +312,7 @@ class FabricSerializer:
         Returns:
             Base64-encoded string
         """
-        json_str = json.dumps(data, indent=2)
-        return base64.b64encode(json_str.encode()).decode()
+        return base64.b64encode(dumps_fast(data)).decode()
     
     @staticmethod
     def decode_payload(encoded: str) -> Any:
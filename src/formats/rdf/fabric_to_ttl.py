@@ -15,6 +15,8 @@ from typing import Dict, List, Any, Optional, Tuple, Set, Literal
 from rdflib import Graph, Namespace, RDF, RDFS, OWL, XSD, URIRef, BNode
 from rdflib.term import Literal as RDFLiteral
 
+from .uri_utils import _INVALID_NAME_CHARS
+
 logger = logging.getLogger(__name__)
 
 # Type alias for Fabric value types
@@ -63,7 +65,7 @@ class FabricToTTLConverter:
     def _sanitize_name(self, name: str) -> str:
         """Sanitize a name for use as a URI local name."""
         # Replace spaces and special chars with underscores
-        sanitized = ''.join(c if c.isalnum() or c == '_' else '_' for c in name)
+        sanitized = _INVALID_NAME_CHARS.sub('_', name)
         # Ensure starts with letter
         if sanitized and not sanitized[0].isalpha():
             sanitized = 'C_' + sanitized
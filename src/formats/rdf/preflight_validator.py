@@ -17,6 +17,8 @@ from pathlib import Path
 from typing import Dict, List, Any, Optional, Set, Tuple, Union
 from rdflib import Graph, Namespace, RDF, RDFS, OWL, XSD, URIRef, Literal, BNode
 from .rdf_parser import RDFGraphParser
+from .type_mapper import XSD_PREFIX
+from .uri_utils import _INVALID_NAME_CHARS
 
 logger = logging.getLogger(__name__)
 
@@ -373,14 +375,14 @@ class PreflightValidator:
             if (s, OWL.qualifiedCardinality, None) in self.graph:
                 restriction_types.append("qualifiedCardinality")
             
-            on_property = list(self.graph.objects(s, OWL.onProperty))
-            prop_name = self._uri_to_name(on_property[0]) if on_property else "unknown"
+            on_property = next(self.graph.objects(s, OWL.onProperty), None)
+            prop_name = self._uri_to_name(on_property) if on_property is not None else "unknown"
             
             self._add_issue(
                 IssueCategory.PROPERTY_RESTRICTION,
                 IssueSeverity.WARNING,
                 f"OWL restriction on property '{prop_name}': {', '.join(restriction_types) or 'generic'}",
-                uri=str(on_property[0]) if on_property else None,
+                uri=str(on_property) if on_property is not None else None,
                 details="Property restrictions (cardinality, value constraints) are not preserved.",
                 recommendation="Remove restrictions or document expected constraints separately.",
             )
@@ -522,7 +524,7 @@ class PreflightValidator:
                     if isinstance(range_val, URIRef):
                         range_str = str(range_val)
                         # Check if it's a class reference (not XSD type)
-                        if not range_str.startswith(str(XSD)) and range_str not in SUPPORTED_XSD_TYPES:
+                        if not range_str.startswith(XSD_PREFIX) and range_str not in SUPPORTED_XSD_TYPES:
                             if range_str not in self.declared_classes:
                                 self._add_issue(
                                     IssueCategory.MISSING_SIGNATURE,
@@ -542,7 +544,7 @@ class PreflightValidator:
             for range_val in self.graph.objects(prop_uri, RDFS.range):
                 if isinstance(range_val, URIRef):
                     range_str = str(range_val)
-                    if range_str.startswith(str(XSD)) and range_str not in SUPPORTED_XSD_TYPES:
+                    if range_str.startswith(XSD_PREFIX) and range_str not in SUPPORTED_XSD_TYPES:
                         self._add_issue(
                             IssueCategory.UNSUPPORTED_DATATYPE,
                             IssueSeverity.INFO,
@@ -740,7 +742,7 @@ def generate_import_log(
     os.makedirs(output_dir, exist_ok=True)
     
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    safe_name = ''.join(c if c.isalnum() or c == '_' else '_' for c in ontology_name)
+    safe_name = _INVALID_NAME_CHARS.sub('_', ontology_name)
     log_filename = f"import_log_{safe_name}_{timestamp}.json"
     log_path = os.path.join(output_dir, log_filename)
     
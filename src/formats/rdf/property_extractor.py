@@ -11,14 +11,14 @@ Components:
 """
 
 import logging
-from typing import Dict, List, Set, Optional, Tuple, Any, Callable
+from collections import Counter
+from typing import Dict, Iterable, List, Set, Optional, Tuple, Any, Callable, Collection, TypeVar
 
 from rdflib import Graph, RDF, RDFS, OWL, URIRef, BNode
 from rdflib.term import Node
-from tqdm import tqdm
 
 # Import from sibling modules
-from .type_mapper import TypeMapper, XSD_TO_FABRIC_TYPE
+from .type_mapper import TypeMapper, XSD_PREFIX, XSD_TO_FABRIC_TYPE
 from .uri_utils import URIUtils
 from .class_resolver import ClassResolver
 
@@ -33,6 +33,152 @@ from src.shared.models import (
 
 logger = logging.getLogger(__name__)
 
+# Minimum number of classes before entity type creation shows a progress bar
+CLASS_PROGRESS_THRESHOLD = 1000
+
+# rdf:type objects that declare a class
+_CLASS_TYPES: List[Node] = [OWL.Class, RDFS.Class]
+
+# Fabric value types allowed in entityIdParts
+_KEY_VALUE_TYPES = frozenset({"String", "BigInt"})
+
+# Relationship types are keyed by (property URI, domain URI, range URI) so
+# one object property can yield a relationship per domain/range pair.
+RelationshipKey = Tuple[str, str, str]
+
+_T = TypeVar("_T")
+
+
+def _progress(items: Collection[_T], threshold: int, **tqdm_kwargs: Any) -> Iterable[_T]:
+    """
+    Wrap a sized collection in a tqdm progress bar only when it is large.
+    
+    tqdm is imported lazily so conversions of small ontologies never pay
+    its import cost.
+    
+    Args:
+        items: Collection to iterate (must support len())
+        threshold: Minimum number of items before a progress bar is shown
+        **tqdm_kwargs: Passed through to tqdm
+        
+    Returns:
+        The collection itself or a tqdm wrapper around it
+    """
+    if len(items) < threshold:
+        return items
+    from tqdm import tqdm
+    progress_bar: Iterable[_T] = tqdm(items, **tqdm_kwargs)
+    return progress_bar
+
+
+class GraphIndex:
+    """
+    Per-conversion memo of (subject, predicate) -> objects lookups.
+    
+    The extraction phases ask the graph for the same domains, ranges and
+    rdf:types many times over. Sharing one GraphIndex between them turns
+    repeat lookups into dict hits. Results keep rdflib's object order, so
+    "first range" and domain ordering are identical to querying the graph
+    directly.
+    
+    The index assumes the graph is not modified while it is in use.
+    """
+    
+    __slots__ = ("graph", "_objects", "_class_targets")
+    
+    def __init__(self, graph: Graph):
+        self.graph = graph
+        self._objects: Dict[Tuple[Node, Node], Tuple[Node, ...]] = {}
+        self._class_targets: Dict[Node, Tuple[str, ...]] = {}
+    
+    def objects(self, subject: Node, predicate: Node) -> Tuple[Node, ...]:
+        """Return all objects for (subject, predicate), in graph order."""
+        key = (subject, predicate)
+        try:
+            return self._objects[key]
+        except KeyError:
+            found = self._objects[key] = tuple(self.graph.objects(subject, predicate))
+            return found
+    
+    def value(self, subject: Node, predicate: Node) -> Optional[Node]:
+        """Return the first object for (subject, predicate), or None."""
+        found = self.objects(subject, predicate)
+        return found[0] if found else None
+    
+    def class_targets(self, node: Node) -> Tuple[str, ...]:
+        """
+        Return ClassResolver.resolve_class_targets(graph, node), memoized.
+        
+        Shared owl:unionOf expressions used as the domain or range of many
+        properties are walked once per conversion.
+        """
+        try:
+            return self._class_targets[node]
+        except KeyError:
+            found = self._class_targets[node] = tuple(
+                ClassResolver.resolve_class_targets(self.graph, node)
+            )
+            return found
+
+
+def classify_rdf_properties(
+    graph: Graph,
+    graph_index: Optional[GraphIndex] = None,
+) -> Tuple[Set[URIRef], Set[URIRef]]:
+    """
+    Split plain rdf:Property declarations by the kind of their range.
+    
+    Only the first rdfs:range is considered, and only when it is a URI.
+    Computing this once lets the data and object property extractors share
+    a single pass over the rdf:Property declarations.
+    
+    Args:
+        graph: The RDF graph to inspect
+        graph_index: Optional shared lookup index for the graph
+        
+    Returns:
+        Tuple of (properties with an XSD range, properties with any other URI range)
+    """
+    if graph_index is None:
+        graph_index = GraphIndex(graph)
+    xsd_range_props: Set[URIRef] = set()
+    entity_range_props: Set[URIRef] = set()
+    
+    for s in graph.subjects(RDF.type, RDF.Property):
+        if not isinstance(s, URIRef):
+            continue
+        range_uri = graph_index.value(s, RDFS.range)
+        if not isinstance(range_uri, URIRef):
+            continue
+        range_str = str(range_uri)
+        if range_str.startswith(XSD_PREFIX) or range_str in XSD_TO_FABRIC_TYPE:
+            xsd_range_props.add(s)
+        else:
+            entity_range_props.add(s)
+    
+    return xsd_range_props, entity_range_props
+
+
+def _declared_classes(graph_index: GraphIndex, prop_uri: URIRef, predicate: URIRef) -> List[str]:
+    """
+    Resolve a property's rdfs:domain or rdfs:range declarations to class URIs.
+    
+    Depends only on the graph, so it can be computed per property in any
+    order, independently of ID generation and naming.
+    
+    Args:
+        graph_index: Lookup index over the source graph
+        prop_uri: URI of the property
+        predicate: RDFS.domain or RDFS.range
+        
+    Returns:
+        Class URIs in declaration order, with unionOf expressions expanded
+    """
+    targets: List[str] = []
+    for node in graph_index.objects(prop_uri, predicate):
+        targets.extend(graph_index.class_targets(node))
+    return targets
+
 
 class ClassExtractor:
     """
@@ -49,7 +195,8 @@ class ClassExtractor:
     def extract_classes(
         graph: Graph,
         id_generator: Callable[[], str],
-        uri_to_name: Callable[[URIRef], str]
+        uri_to_name: Callable[[URIRef], str],
+        graph_index: Optional[GraphIndex] = None,
     ) -> Tuple[Dict[str, EntityType], Dict[str, str]]:
         """
         Extract all OWL/RDFS classes as entity types.
@@ -58,78 +205,152 @@ class ClassExtractor:
             graph: The RDF graph to extract from
             id_generator: Function to generate unique IDs
             uri_to_name: Function to convert URIs to names
+            graph_index: Optional lookup index shared with other phases
             
         Returns:
             Tuple of (entity_types dict keyed by URI, uri_to_id mapping)
         """
-        entity_types: Dict[str, EntityType] = {}
-        uri_to_id: Dict[str, str] = {}
-        
-        # Find all classes
+        if graph_index is None:
+            graph_index = GraphIndex(graph)
+        # Find all classes: OWL/RDFS class declarations plus anything with
+        # a subclass relationship
         classes: Set[URIRef] = set()
+        # One store query for all class-declaring rdf:type objects
+        classes.update(
+            s for s, _, _ in graph.triples_choices((None, RDF.type, _CLASS_TYPES))
+            if isinstance(s, URIRef)
+        )
+        classes.update(
+            s for s, _, _ in graph.triples((None, RDFS.subClassOf, None))
+            if isinstance(s, URIRef)
+        )
         
-        # OWL classes
-        for s in graph.subjects(RDF.type, OWL.Class):
-            if isinstance(s, URIRef):
-                classes.add(s)
-        
-        # RDFS classes
-        for s in graph.subjects(RDF.type, RDFS.Class):
-            if isinstance(s, URIRef):
-                classes.add(s)
-        
-        # Classes with subclass relationships
-        for s in graph.subjects(RDFS.subClassOf, None):
-            if isinstance(s, URIRef):
-                classes.add(s)
-        
-        logger.info(f"Found {len(classes)} classes")
+        logger.info("Found %d classes", len(classes))
         
         if len(classes) == 0:
             logger.warning("No OWL/RDFS classes found in ontology")
         
-        # First pass: create all entity types without parent relationships
-        for class_uri in tqdm(classes, desc="Creating entity types", unit="class", disable=len(classes) < 10):
-            entity_id = id_generator()
-            name = uri_to_name(class_uri)
-            
-            entity_type = EntityType(
-                id=entity_id,
-                name=name,
+        # First pass: create all entity types without parent relationships.
+        # The body is trivial, so the progress bar is only worth its
+        # per-iteration cost on very large ontologies.
+        class_iter = _progress(
+            classes, CLASS_PROGRESS_THRESHOLD,
+            desc="Creating entity types", unit="class", mininterval=0.5,
+        )
+
+        entity_types: Dict[str, EntityType] = {
+            str(class_uri): EntityType(
+                id=id_generator(),
+                name=uri_to_name(class_uri),
                 baseEntityTypeId=None,  # Set in second pass
             )
-            
-            entity_types[str(class_uri)] = entity_type
-            uri_to_id[str(class_uri)] = entity_id
-            logger.debug(f"Created entity type: {name} (ID: {entity_id})")
+            for class_uri in class_iter
+        }
+        uri_to_id: Dict[str, str] = {uri: entity_type.id for uri, entity_type in entity_types.items()}
         
-        # Second pass: set parent relationships with cycle detection
-        def has_cycle(class_uri: URIRef, path: set) -> bool:
-            """Check if following parent chain creates a cycle."""
-            if class_uri in path:
-                return True
-            new_path = path | {class_uri}
-            for parent in graph.objects(class_uri, RDFS.subClassOf):
-                if isinstance(parent, URIRef) and parent in classes:
-                    if has_cycle(parent, new_path):
-                        return True
-            return False
+        # Second pass: set parent relationships with cycle detection.
+        # Parents are kept in graph order so the first non-circular one wins.
+        parents: Dict[URIRef, List[URIRef]] = {
+            class_uri: [
+                parent for parent in graph_index.objects(class_uri, RDFS.subClassOf)
+                if isinstance(parent, URIRef) and parent in classes
+            ]
+            for class_uri in classes
+        }
+        reaches_cycle = ClassExtractor._find_cycle_reaching(parents)
         
-        for class_uri in classes:
-            for parent in graph.objects(class_uri, RDFS.subClassOf):
-                if isinstance(parent, URIRef) and str(parent) in uri_to_id:
-                    # Check for cycles
-                    if has_cycle(parent, {class_uri}):
-                        logger.warning(
-                            f"Circular inheritance detected for {uri_to_name(class_uri)}, "
-                            f"skipping parent {uri_to_name(parent)}"
-                        )
-                        continue
-                    
-                    entity_types[str(class_uri)].baseEntityTypeId = uri_to_id[str(parent)]
-                    break  # Only take first non-circular parent
+        for class_uri, class_parents in parents.items():
+            entity_type = entity_types[str(class_uri)]
+            for parent in class_parents:
+                # Check for cycles
+                if parent in reaches_cycle:
+                    logger.warning(
+                        "Circular inheritance detected for %s, skipping parent %s",
+                        uri_to_name(class_uri), uri_to_name(parent),
+                    )
+                    continue
+                
+                entity_type.baseEntityTypeId = uri_to_id[str(parent)]
+                break  # Only take first non-circular parent
         
         return entity_types, uri_to_id
+    
+    @staticmethod
+    def _find_cycle_reaching(parents: Dict[URIRef, List[URIRef]]) -> Set[URIRef]:
+        """
+        Find classes whose parent chain runs into a cycle.
+        
+        Uses an iterative Tarjan SCC pass over the parent adjacency, so the
+        whole hierarchy is checked in O(V + E) without recursion. A class is
+        included if it belongs to a cycle (including a self-loop) or if any
+        of its ancestors does.
+        
+        Args:
+            parents: Mapping of class URI to its parent class URIs
+            
+        Returns:
+            Set of class URIs from which a cycle is reachable
+        """
+        index: Dict[URIRef, int] = {}
+        lowlink: Dict[URIRef, int] = {}
+        on_stack: Set[URIRef] = set()
+        scc_stack: List[URIRef] = []
+        reaches_cycle: Set[URIRef] = set()
+        counter = 0
+        
+        for root in parents:
+            if root in index:
+                continue
+            index[root] = lowlink[root] = counter
+            counter += 1
+            scc_stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(parents[root]))]
+            
+            while work:
+                node, children = work[-1]
+                advanced = False
+                for child in children:
+                    if child not in index:
+                        index[child] = lowlink[child] = counter
+                        counter += 1
+                        scc_stack.append(child)
+                        on_stack.add(child)
+                        work.append((child, iter(parents.get(child, ()))))
+                        advanced = True
+                        break
+                    if child in on_stack and index[child] < lowlink[node]:
+                        lowlink[node] = index[child]
+                if advanced:
+                    continue
+                
+                work.pop()
+                if work:
+                    caller = work[-1][0]
+                    if lowlink[node] < lowlink[caller]:
+                        lowlink[caller] = lowlink[node]
+                
+                if lowlink[node] != index[node]:
+                    continue
+                
+                # node is the root of an SCC. SCCs are emitted sinks first, so
+                # every ancestor outside this component is already classified.
+                component: List[URIRef] = []
+                while True:
+                    member = scc_stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                node_parents = parents.get(node, ())
+                if (
+                    len(component) > 1
+                    or node in node_parents
+                    or any(parent in reaches_cycle for parent in node_parents)
+                ):
+                    reaches_cycle.update(component)
+        
+        return reaches_cycle
 
 
 class DataPropertyExtractor:
@@ -149,6 +370,8 @@ class DataPropertyExtractor:
         entity_types: Dict[str, EntityType],
         id_generator: Callable[[], str],
         uri_to_name: Callable[[URIRef], str],
+        rdf_property_ranges: Optional[Tuple[Set[URIRef], Set[URIRef]]] = None,
+        graph_index: Optional[GraphIndex] = None,
     ) -> Tuple[Dict[str, str], Dict[str, str]]:
         """
         Extract data properties and add them to entity types.
@@ -158,76 +381,67 @@ class DataPropertyExtractor:
             entity_types: Dictionary of entity types keyed by URI
             id_generator: Function to generate unique IDs
             uri_to_name: Function to convert URIs to names
+            rdf_property_ranges: Optional precomputed result of
+                classify_rdf_properties(graph)
+            graph_index: Optional lookup index shared with other phases
             
         Returns:
             Tuple of (property_to_domain mapping, uri_to_id mapping for properties)
         """
+        if graph_index is None:
+            graph_index = GraphIndex(graph)
         property_to_domain: Dict[str, str] = {}
         uri_to_id: Dict[str, str] = {}
         
         # Find all data properties
         # Include both OWL.DatatypeProperty and rdf:Property with XSD ranges
-        data_properties: Set[URIRef] = set()
         owl_datatype_props: Set[URIRef] = set()
-        rdf_props_with_xsd_range: Set[URIRef] = set()
 
         for s in graph.subjects(RDF.type, OWL.DatatypeProperty):
             if isinstance(s, URIRef):
                 owl_datatype_props.add(s)
 
         # Any rdf:Property whose rdfs:range is an XSD type should be treated as a data property
-        for s in graph.subjects(RDF.type, RDF.Property):
-            if not isinstance(s, URIRef):
-                continue
-            ranges = list(graph.objects(s, RDFS.range))
-            if not ranges:
-                continue
-            range_uri = ranges[0] if isinstance(ranges[0], URIRef) else None
-            if range_uri is None:
-                continue
-            range_str = str(range_uri)
-            from rdflib import XSD
-            if range_str in XSD_TO_FABRIC_TYPE or range_str.startswith(str(XSD)):
-                rdf_props_with_xsd_range.add(s)
+        if rdf_property_ranges is None:
+            rdf_property_ranges = classify_rdf_properties(graph, graph_index)
+        rdf_props_with_xsd_range = rdf_property_ranges[0]
 
-        data_properties = owl_datatype_props | rdf_props_with_xsd_range
+        data_properties: Set[URIRef] = owl_datatype_props | rdf_props_with_xsd_range
 
-        logger.info(f"Found {len(data_properties)} data properties")
+        logger.info("Found %d data properties", len(data_properties))
 
         for prop_uri in data_properties:
+            prop_str = str(prop_uri)
             prop_id = id_generator()
             name = uri_to_name(prop_uri)
             
             # Get domain (which entity type this property belongs to)
-            raw_domains = list(graph.objects(prop_uri, RDFS.domain))
-            domains: List[str] = []
-            for d in raw_domains:
-                domains.extend(ClassResolver.resolve_class_targets(graph, d))
+            domains = _declared_classes(graph_index, prop_uri, RDFS.domain)
             
             # Get range (value type) with datatype union support
-            ranges = list(graph.objects(prop_uri, RDFS.range))
+            first_range = graph_index.value(prop_uri, RDFS.range)
             value_type = "String"  # Default
             union_notes = ""
             
-            if ranges:
-                if isinstance(ranges[0], URIRef):
-                    value_type = TypeMapper.get_fabric_type(str(ranges[0]))
-                elif isinstance(ranges[0], BNode):
+            if first_range is not None:
+                if isinstance(first_range, URIRef):
+                    value_type = TypeMapper.get_fabric_type(str(first_range))
+                elif isinstance(first_range, BNode):
                     # Resolve datatype union to most restrictive compatible type
                     value_type, union_notes = TypeMapper.resolve_datatype_union(
-                        graph, ranges[0], ClassResolver.resolve_rdf_list
+                        graph, first_range, ClassResolver.resolve_rdf_list
                     )
                     if union_notes:
-                        logger.debug(f"Property {name}: {union_notes}")
+                        logger.debug("Property %s: %s", name, union_notes)
             
             # Check rdfs:comment for "(timeseries)" annotation
             is_timeseries = False
-            comments = list(graph.objects(prop_uri, RDFS.comment))
-            if comments:
-                comment_text = str(comments[0]).lower()
+            comment = graph_index.value(prop_uri, RDFS.comment)
+            if comment is not None:
+                comment_text = str(comment).lower()
                 if "(timeseries)" in comment_text:
                     is_timeseries = True
-                    logger.debug(f"Property {name} marked as timeseries from rdfs:comment")
+                    logger.debug("Property %s marked as timeseries from rdfs:comment", name)
             
             prop = EntityTypeProperty(
                 id=prop_id,
@@ -244,10 +458,14 @@ class DataPropertyExtractor:
                         entity_types[domain_uri].timeseriesProperties.append(prop)
                     else:
                         entity_types[domain_uri].properties.append(prop)
-                    property_to_domain[str(prop_uri)] = domain_uri
-                    logger.debug(f"Added {'timeseries ' if is_timeseries else ''}property {name} to entity type {entity_types[domain_uri].name}")
+                    property_to_domain[prop_str] = domain_uri
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            "Added %sproperty %s to entity type %s",
+                            'timeseries ' if is_timeseries else '', name, entity_types[domain_uri].name,
+                        )
             
-            uri_to_id[str(prop_uri)] = prop_id
+            uri_to_id[prop_str] = prop_id
         
         return property_to_domain, uri_to_id
 
@@ -270,8 +488,10 @@ class ObjectPropertyExtractor:
         property_to_domain: Dict[str, str],
         id_generator: Callable[[], str],
         uri_to_name: Callable[[URIRef], str],
-        skip_callback: Optional[Callable[[str, str, str, str], None]] = None
-    ) -> Tuple[Dict[str, RelationshipType], Dict[str, str]]:
+        skip_callback: Optional[Callable[[str, str, str, str], None]] = None,
+        rdf_property_ranges: Optional[Tuple[Set[URIRef], Set[URIRef]]] = None,
+        graph_index: Optional[GraphIndex] = None,
+    ) -> Tuple[Dict[RelationshipKey, RelationshipType], Dict[RelationshipKey, str]]:
         """
         Extract object properties as relationship types.
         
@@ -282,94 +502,101 @@ class ObjectPropertyExtractor:
             id_generator: Function to generate unique IDs
             uri_to_name: Function to convert URIs to names
             skip_callback: Optional callback for skipped items (item_type, name, reason, uri)
+            rdf_property_ranges: Optional precomputed result of
+                classify_rdf_properties(graph)
+            graph_index: Optional lookup index shared with other phases
             
         Returns:
-            Tuple of (relationship_types dict keyed by unique key, uri_to_id mapping)
+            Tuple of (relationship_types dict keyed by RelationshipKey,
+            uri_to_id mapping with the same keys)
         """
-        from rdflib import XSD
+        if graph_index is None:
+            graph_index = GraphIndex(graph)
+        relationship_types: Dict[RelationshipKey, RelationshipType] = {}
+        uri_to_id: Dict[RelationshipKey, str] = {}
         
-        relationship_types: Dict[str, RelationshipType] = {}
-        uri_to_id: Dict[str, str] = {}
-        
-        object_properties: Set[URIRef] = set()
         owl_object_props: Set[URIRef] = set()
-        rdf_props_with_entity_range: Set[URIRef] = set()
 
         for s in graph.subjects(RDF.type, OWL.ObjectProperty):
             if isinstance(s, URIRef):
                 owl_object_props.add(s)
 
-        # Consider rdf:Property whose range refers to a known entity type (non-XSD) as object properties
-        for s in graph.subjects(RDF.type, RDF.Property):
-            if not isinstance(s, URIRef):
-                continue
-            ranges = list(graph.objects(s, RDFS.range))
-            if not ranges:
-                continue
-            range_candidate = ranges[0]
-            if isinstance(range_candidate, URIRef):
-                range_str = str(range_candidate)
-                if (range_str not in XSD_TO_FABRIC_TYPE) and not range_str.startswith(str(XSD)):
-                    # We'll add it; we'll verify existence later when creating the relationship
-                    rdf_props_with_entity_range.add(s)
-
-        # Convert string keys to URIRef for set difference
-        known_props: Set[URIRef] = {URIRef(k) for k in property_to_domain.keys()}
-        object_properties = owl_object_props | (rdf_props_with_entity_range - known_props)
-
-        logger.info(f"Found {len(object_properties)} object properties")
+        # Consider rdf:Property whose range refers to a known entity type (non-XSD) as object properties.
+        # Existence of the range class is verified later when creating the relationship.
+        if rdf_property_ranges is None:
+            rdf_property_ranges = classify_rdf_properties(graph, graph_index)
+        rdf_props_with_entity_range = rdf_property_ranges[1]
+
+        # Skip rdf:Property entries already claimed as data properties;
+        # property_to_domain is str-keyed, so test membership per URI
+        object_properties: Set[URIRef] = set(owl_object_props)
+        for s in rdf_props_with_entity_range:
+            if str(s) not in property_to_domain:
+                object_properties.add(s)
+
+        logger.info("Found %d object properties", len(object_properties))
         
-        # Build usage map for inference
-        property_usage: Dict[str, Dict[str, Set[Any]]] = {}  # prop_uri -> {subjects: set, objects: set}
-        for prop_uri in object_properties:
-            property_usage[str(prop_uri)] = {'subjects': set(), 'objects': set()}
+        # Build usage map for inference. The scan compares rdflib terms
+        # directly against URIRef-keyed entity types; usage counters hold
+        # URIRefs and are only converted to str when a type is picked.
+        entity_type_refs: Set[URIRef] = {URIRef(uri) for uri in entity_types}
+        property_usage: Dict[str, Dict[str, Counter]] = {}  # prop_uri -> {subjects: Counter, objects: Counter}
         
-        # Scan for actual usage patterns in the graph
-        for s, p, o in graph:
-            if str(p) in property_usage:
-                # Get types of subject and object
-                for subj_type in graph.objects(s, RDF.type):
-                    if str(subj_type) in entity_types:
-                        property_usage[str(p)]['subjects'].add(str(subj_type))
-                
+        # rdf:types of each node, already narrowed to converted entity
+        # types, so the scan below does one dict hit per usage endpoint
+        node_entity_types: Dict[Node, Tuple[Node, ...]] = {}
+
+        def entity_types_of(node: Node) -> Tuple[Node, ...]:
+            try:
+                return node_entity_types[node]
+            except KeyError:
+                found = node_entity_types[node] = tuple(
+                    t for t in graph_index.objects(node, RDF.type) if t in entity_type_refs
+                )
+                return found
+
+        # Scan for actual usage patterns, visiting only triples whose
+        # predicate is one of the object properties
+        for prop_uri in object_properties:
+            usage = property_usage[str(prop_uri)] = {'subjects': Counter(), 'objects': Counter()}
+            for s, _, o in graph.triples((None, prop_uri, None)):
+                # Count entity types of subject and object
+                usage['subjects'].update(entity_types_of(s))
                 if isinstance(o, URIRef):
-                    for obj_type in graph.objects(o, RDF.type):
-                        if str(obj_type) in entity_types:
-                            property_usage[str(p)]['objects'].add(str(obj_type))
+                    usage['objects'].update(entity_types_of(o))
         
-        for prop_uri in tqdm(object_properties, desc="Processing relationships", unit="property", disable=len(object_properties) < 10):
+        for prop_uri in _progress(object_properties, 10, desc="Processing relationships", unit="property"):
+            prop_str = str(prop_uri)
             name = uri_to_name(prop_uri)
             
-            # Get explicit domain and range
-            raw_domains = list(graph.objects(prop_uri, RDFS.domain))
-            raw_ranges = list(graph.objects(prop_uri, RDFS.range))
-
-            domain_uris: List[str] = []
-            range_uris: List[str] = []
-
             # Try explicit declarations first, including unionOf class expressions
-            for d in raw_domains:
-                domain_uris.extend(ClassResolver.resolve_class_targets(graph, d))
-            for r in raw_ranges:
-                range_uris.extend(ClassResolver.resolve_class_targets(graph, r))
-
-            domain_uris = [u for u in domain_uris if u in entity_types]
-            range_uris = [u for u in range_uris if u in entity_types]
+            domain_uris = [
+                u for u in _declared_classes(graph_index, prop_uri, RDFS.domain)
+                if u in entity_types
+            ]
+            range_uris = [
+                u for u in _declared_classes(graph_index, prop_uri, RDFS.range)
+                if u in entity_types
+            ]
             
             # Fall back to inference from usage
             if not domain_uris:
-                usage = property_usage.get(str(prop_uri), {})
+                usage = property_usage.get(prop_str, {})
                 if usage.get('subjects'):
                     # Use most common subject type
-                    domain_uris = [next(iter(usage['subjects']))]
-                    logger.debug(f"Inferred domain for {name}: {uri_to_name(URIRef(domain_uris[0]))}")
+                    inferred = usage['subjects'].most_common(1)[0][0]
+                    domain_uris = [str(inferred)]
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Inferred domain for %s: %s", name, uri_to_name(inferred))
             
             if not range_uris:
-                usage = property_usage.get(str(prop_uri), {})
+                usage = property_usage.get(prop_str, {})
                 if usage.get('objects'):
                     # Use most common object type
-                    range_uris = [next(iter(usage['objects']))]
-                    logger.debug(f"Inferred range for {name}: {uri_to_name(URIRef(range_uris[0]))}")
+                    inferred = usage['objects'].most_common(1)[0][0]
+                    range_uris = [str(inferred)]
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Inferred range for %s: %s", name, uri_to_name(inferred))
             
             if not domain_uris or not range_uris:
                 # Determine specific reason for skipping
@@ -381,9 +608,9 @@ class ObjectPropertyExtractor:
                     reason = "missing range class"
                 
                 if skip_callback:
-                    skip_callback("relationship", name, reason, str(prop_uri))
+                    skip_callback("relationship", name, reason, prop_str)
                 else:
-                    logger.warning(f"Skipped relationship '{name}': {reason}")
+                    logger.warning("Skipped relationship '%s': %s", name, reason)
                 continue
 
             # Create relationships for each domain-range pair
@@ -400,18 +627,22 @@ class ObjectPropertyExtractor:
                         target=RelationshipEnd(entityTypeId=entity_types[r_uri].id),
                     )
                     # Store using unique key per pair to avoid overwrite
-                    key = f"{str(prop_uri)}::{d_uri}->{r_uri}"
+                    key = (prop_str, d_uri, r_uri)
                     relationship_types[key] = relationship
                     uri_to_id[key] = rel_id
                     created_any = True
-                    logger.debug(f"Created relationship type: {name} ({uri_to_name(URIRef(d_uri))} -> {uri_to_name(URIRef(r_uri))})")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            "Created relationship type: %s (%s -> %s)",
+                            name, uri_to_name(URIRef(d_uri)), uri_to_name(URIRef(r_uri)),
+                        )
             
             if not created_any:
                 if skip_callback:
                     skip_callback(
                         "relationship", name,
                         "domain or range entity type not found in converted classes",
-                        str(prop_uri)
+                        prop_str
                     )
         
         return relationship_types, uri_to_id
@@ -436,24 +667,23 @@ class EntityIdentifierSetter:
         """
         for entity_uri, entity_type in entity_types.items():
             if entity_type.properties:
-                # Find an ID property or use the first property
+                # Find an ID property or use the first valid key property,
+                # collecting all candidates in a single pass
                 id_prop = None
                 name_prop = None
+                first_valid_key_prop = None
                 
                 for prop in entity_type.properties:
                     prop_name_lower = prop.name.lower()
                     # Only String and BigInt are valid for entity keys
-                    if 'id' in prop_name_lower and prop.valueType in ("String", "BigInt"):
-                        id_prop = prop
+                    if prop.valueType in _KEY_VALUE_TYPES:
+                        if first_valid_key_prop is None:
+                            first_valid_key_prop = prop
+                        if 'id' in prop_name_lower:
+                            id_prop = prop
                     if 'name' in prop_name_lower and prop.valueType == "String":
                         name_prop = prop
                 
-                # Find first valid key property (String or BigInt only)
-                first_valid_key_prop = next(
-                    (p for p in entity_type.properties if p.valueType in ("String", "BigInt")), 
-                    None
-                )
-                
                 # Only set entityIdParts if we have a valid property
                 if id_prop:
                     entity_type.entityIdParts = [id_prop.id]
@@ -22,11 +22,19 @@ Architecture:
     re-exported here for backward compatibility.
 """
 
+import copy
+import hashlib
 import logging
+import os
+import sys
+import threading
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
 from pathlib import Path
 from typing import (
-    Dict, List, Any, Optional, Tuple, Union, 
-    Callable, Literal, cast
+    BinaryIO, Dict, Iterator, List, Any, Optional, Tuple, Union, 
+    Callable, Literal, cast, overload
 )
 from dataclasses import dataclass
 
@@ -39,12 +47,15 @@ from .property_extractor import (
     DataPropertyExtractor,
     ObjectPropertyExtractor,
     EntityIdentifierSetter,
+    classify_rdf_properties,
+    GraphIndex,
+    RelationshipKey,
 )
 from .type_mapper import TypeMapper, XSD_TO_FABRIC_TYPE
-from .uri_utils import URIUtils
+from .uri_utils import URIUtils, _INVALID_NAME_CHARS
 from .class_resolver import ClassResolver
-from .fabric_serializer import FabricSerializer
-from .streaming_converter import StreamingRDFConverter
+from .fabric_serializer import FabricSerializer, dumps_compact
+from .streaming_converter import StreamingRDFConverter, SKIP_SUMMARY_EXAMPLES
 from src.core.validators import (
     InputValidator,
     FabricLimitsValidator,
@@ -73,6 +84,72 @@ LogLevel = Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
 
 logger = logging.getLogger(__name__)
 
+_ContentCacheKey = Tuple[bytes, int, bool, Optional[str], Optional[str]]
+_CachedConversion = Tuple[Dict[str, Any], str, ConversionResult]
+
+
+class ConversionCache:
+    """
+    Caller-owned cache of TTL content conversions.
+    
+    Pass an instance to parse_ttl_content / parse_ttl_with_result to reuse
+    conversions of identical content (same digest and options). Nothing is
+    cached unless a cache is passed in. Entries are evicted least recently
+    used first once the cached content exceeds max_chars in total.
+    
+    A cache hit skips the converter, so memory checks are not repeated and
+    skipped-item, warning and validation messages are not logged again;
+    they remain available on the returned ConversionResult.
+    
+    Args:
+        max_chars: Upper bound on the total length of cached content
+        copy_results: If True, results are deep-copied in and out so callers
+            may mutate them. Set False when callers treat results as read-only.
+    """
+    
+    def __init__(self, max_chars: int = 50 * 1024 * 1024, copy_results: bool = True):
+        self.max_chars = max_chars
+        self.copy_results = copy_results
+        self._entries: "OrderedDict[_ContentCacheKey, Tuple[_CachedConversion, int]]" = OrderedDict()
+        self._total_chars = 0
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+    
+    def get(self, key: _ContentCacheKey) -> Optional[_CachedConversion]:
+        """Return the cached conversion for key, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            value = entry[0]
+        return copy.deepcopy(value) if self.copy_results else value
+    
+    def put(self, key: _ContentCacheKey, value: _CachedConversion, size: int) -> None:
+        """Cache a conversion of content with the given length."""
+        if size > self.max_chars:
+            return
+        if self.copy_results:
+            value = copy.deepcopy(value)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._total_chars -= previous[1]
+            self._entries[key] = (value, size)
+            self._total_chars += size
+            while self._total_chars > self.max_chars:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._total_chars -= evicted
+    
+    def clear(self) -> None:
+        """Drop all cached conversions."""
+        with self._lock:
+            self._entries.clear()
+            self._total_chars = 0
+
 
 # Re-export DefinitionValidationError and FabricDefinitionValidator for backward compatibility
 # These have been moved to core.validators.definition
@@ -86,7 +163,9 @@ __all__ = [
     'parse_ttl_file_with_result',
     'parse_ttl_with_result',
     'parse_ttl_streaming',
+    'parse_ttl_files',
     'convert_to_fabric_definition',
+    'ConversionCache',
 ]
 
 
@@ -116,12 +195,16 @@ class RDFToFabricConverter:
         self.id_counter = 0
         self.loose_inference = loose_inference
         self.entity_types: Dict[str, EntityType] = {}
-        self.relationship_types: Dict[str, RelationshipType] = {}
-        self.uri_to_id: Dict[str, str] = {}
+        self.relationship_types: Dict[RelationshipKey, RelationshipType] = {}
+        self.uri_to_id: Dict[Union[str, RelationshipKey], str] = {}
         self.property_to_domain: Dict[str, str] = {}
+        # Graph parsed by the most recent conversion
+        self.graph: Optional[Graph] = None
         # Error recovery tracking
         self.skipped_items: List[SkippedItem] = []
         self.conversion_warnings: List[str] = []
+        # Set by one-shot callers that discard the converter afterwards
+        self._hand_off_results = False
         
         # Composed components (used via delegation)
         self._type_mapper = TypeMapper()
@@ -133,10 +216,25 @@ class RDFToFabricConverter:
         self.relationship_types = {}
         self.uri_to_id = {}
         self.property_to_domain = {}
+        self.graph = None
         self.id_counter = 0
         self.skipped_items = []
         self.conversion_warnings = []
 
+    def _take_result_lists(self) -> Tuple[List[SkippedItem], List[str]]:
+        """
+        Get the skipped items and warnings for a ConversionResult.
+        
+        Converters created by the module-level parse functions are
+        discarded after one conversion, so they hand their lists over
+        instead of copying them; otherwise the caller gets copies.
+        """
+        if self._hand_off_results:
+            skipped, warnings = self.skipped_items, self.conversion_warnings
+            self.skipped_items, self.conversion_warnings = [], []
+            return skipped, warnings
+        return self.skipped_items.copy(), self.conversion_warnings.copy()
+
     def _add_skipped_item(
         self, 
         item_type: str, 
@@ -151,7 +249,20 @@ class RDFToFabricConverter:
             reason=reason,
             uri=uri
         ))
-        logger.warning(f"Skipped {item_type} '{name}': {reason}")
+        logger.debug("Skipped %s '%s': %s", item_type, name, reason)
+
+    def _flush_skip_summary(self) -> None:
+        """Log one summary warning per skipped item type."""
+        names_by_type: Dict[str, List[str]] = defaultdict(list)
+        for item in self.skipped_items:
+            names_by_type[item.item_type].append(item.name)
+        for item_type, names in names_by_type.items():
+            examples = ", ".join(names[:SKIP_SUMMARY_EXAMPLES])
+            if len(names) > SKIP_SUMMARY_EXAMPLES:
+                examples += ", ..."
+            logger.warning(
+                "Skipped %d %s items (examples: %s)", len(names), item_type, examples
+            )
 
     def _add_warning(self, message: str) -> None:
         """Track a warning during conversion."""
@@ -159,9 +270,14 @@ class RDFToFabricConverter:
         logger.warning(message)
         
     def _generate_id(self) -> str:
-        """Generate a unique ID for entities and properties."""
+        """
+        Generate a unique ID for entities and properties.
+        
+        IDs are interned so every table keyed by them, and any equal ID
+        string produced later, shares one object.
+        """
         self.id_counter += 1
-        return str(self.id_prefix + self.id_counter)
+        return sys.intern(str(self.id_prefix + self.id_counter))
     
     def _uri_to_name(self, uri: URIRef) -> str:
         """Extract a clean name from a URI.
@@ -227,59 +343,52 @@ class RDFToFabricConverter:
             ClassResolver.resolve_rdf_list
         )
     
-    def parse_ttl(
-        self, 
-        ttl_content: str, 
-        force_large_file: bool = False,
-        return_result: bool = False,
-        rdf_format: Optional[str] = None,
-        source_path: Optional[Union[str, Path]] = None,
-    ) -> Union[Tuple[List[EntityType], List[RelationshipType]], ConversionResult]:
+    def _extract_from_graph(
+        self, graph: Graph
+    ) -> Tuple[List[EntityType], List[RelationshipType]]:
         """
-        Parse RDF TTL content and extract entity and relationship types.
+        Extract entity and relationship types from a parsed graph.
         
         Args:
-            ttl_content: The TTL content as a string
-            force_large_file: If True, skip memory safety checks for large files
-            return_result: If True, return ConversionResult with detailed tracking
+            graph: The parsed RDF graph
             
         Returns:
-            If return_result is False: Tuple of (entity_types, relationship_types)
-            If return_result is True: ConversionResult with detailed tracking
-            
-        Raises:
-            ValueError: If TTL content is empty or has invalid syntax
-            MemoryError: If insufficient memory is available to parse the file
+            Tuple of (entity_types, relationship_types)
         """
-        # Delegate TTL parsing to RDFGraphParser
-        graph, triple_count, content_size_mb = RDFGraphParser.parse_ttl_content(
-            ttl_content,
-            force_large_file,
-            rdf_format=rdf_format,
-            source_path=source_path,
-        )
-        
         # Reset state (includes skipped_items and conversion_warnings)
         self._reset_state()
+        self.graph = graph
+        
+        # Graph lookups are shared by all extraction steps
+        graph_index = GraphIndex(graph)
         
         # Step 1: Extract all classes (entity types) using ClassExtractor
         self.entity_types, class_uri_to_id = ClassExtractor.extract_classes(
-            graph, self._generate_id, self._uri_to_name
+            graph, self._generate_id, self._uri_to_name, graph_index=graph_index
         )
-        self.uri_to_id.update(class_uri_to_id)
+        
+        # rdf:Property classification is shared by steps 2 and 3
+        rdf_property_ranges = classify_rdf_properties(graph, graph_index)
         
         # Step 2: Extract data properties using DataPropertyExtractor
         self.property_to_domain, prop_uri_to_id = DataPropertyExtractor.extract_data_properties(
-            graph, self.entity_types, self._generate_id, self._uri_to_name
+            graph, self.entity_types, self._generate_id, self._uri_to_name,
+            rdf_property_ranges=rdf_property_ranges,
+            graph_index=graph_index,
         )
-        self.uri_to_id.update(prop_uri_to_id)
         
         # Step 3: Extract object properties (relationships) using ObjectPropertyExtractor
         self.relationship_types, rel_uri_to_id = ObjectPropertyExtractor.extract_object_properties(
             graph, self.entity_types, self.property_to_domain,
-            self._generate_id, self._uri_to_name, self._add_skipped_item
+            self._generate_id, self._uri_to_name, self._add_skipped_item,
+            rdf_property_ranges=rdf_property_ranges,
+            graph_index=graph_index,
         )
-        self.uri_to_id.update(rel_uri_to_id)
+        # Merge the per-step lookups in one pass instead of growing
+        # uri_to_id step by step
+        self.uri_to_id = dict(chain(
+            class_uri_to_id.items(), prop_uri_to_id.items(), rel_uri_to_id.items()
+        ))
         
         # Step 4: Set entity ID parts and display name properties
         EntityIdentifierSetter.set_identifiers(self.entity_types)
@@ -288,25 +397,118 @@ class RDFToFabricConverter:
         relationship_list = list(self.relationship_types.values())
         
         logger.info(
-            f"Parsed {len(entity_list)} entity types and "
-            f"{len(relationship_list)} relationship types"
+            "Parsed %d entity types and %d relationship types",
+            len(entity_list), len(relationship_list),
         )
         
-        if self.skipped_items:
-            logger.info(f"Skipped {len(self.skipped_items)} items during conversion")
+        self._flush_skip_summary()
+        
+        return entity_list, relationship_list
+    
+    def _build_result(
+        self,
+        graph: Graph,
+        triple_count: int,
+        return_result: bool,
+    ) -> Union[Tuple[List[EntityType], List[RelationshipType]], ConversionResult]:
+        """Run extraction on a parsed graph and shape the return value."""
+        entity_list, relationship_list = self._extract_from_graph(graph)
         
         # Return based on requested format
         if return_result:
+            skipped_items, warnings = self._take_result_lists()
             return ConversionResult(
                 entity_types=entity_list,
                 relationship_types=relationship_list,
-                skipped_items=self.skipped_items.copy(),
-                warnings=self.conversion_warnings.copy(),
+                skipped_items=skipped_items,
+                warnings=warnings,
                 triple_count=triple_count
             )
         
         return entity_list, relationship_list
     
+    def parse_ttl(
+        self, 
+        ttl_content: str, 
+        force_large_file: bool = False,
+        return_result: bool = False,
+        rdf_format: Optional[str] = None,
+        source_path: Optional[Union[str, Path]] = None,
+        safety_checks: bool = True,
+    ) -> Union[Tuple[List[EntityType], List[RelationshipType]], ConversionResult]:
+        """
+        Parse RDF TTL content and extract entity and relationship types.
+        
+        Args:
+            ttl_content: The TTL content as a string
+            force_large_file: If True, skip memory safety checks for large files
+            return_result: If True, return ConversionResult with detailed tracking
+            safety_checks: If False, skip the pre-flight memory check and
+                exact content sizing (trusted, pre-validated input only)
+            
+        Returns:
+            If return_result is False: Tuple of (entity_types, relationship_types)
+            If return_result is True: ConversionResult with detailed tracking
+            
+        Raises:
+            ValueError: If TTL content is empty or has invalid syntax
+            MemoryError: If insufficient memory is available to parse the file
+        """
+        # Delegate TTL parsing to RDFGraphParser
+        graph, triple_count, content_size_mb = RDFGraphParser.parse_ttl_content(
+            ttl_content,
+            force_large_file,
+            rdf_format=rdf_format,
+            source_path=source_path,
+            safety_checks=safety_checks,
+        )
+        
+        return self._build_result(graph, triple_count, return_result)
+    
+    def parse_ttl_file(
+        self,
+        file_path: Union[str, Path],
+        force_large_file: bool = False,
+        return_result: bool = False,
+        rdf_format: Optional[str] = None,
+        safety_checks: bool = True,
+    ) -> Union[Tuple[List[EntityType], List[RelationshipType]], ConversionResult]:
+        """
+        Parse an RDF file and extract entity and relationship types.
+        
+        Unlike parse_ttl, the file is handed to rdflib directly so its
+        content is never held in memory as a Python string. The memory
+        pre-check uses the on-disk file size.
+        
+        Args:
+            file_path: Path to the RDF file
+            force_large_file: If True, skip memory safety checks for large files
+            return_result: If True, return ConversionResult with detailed tracking
+            rdf_format: Optional explicit serialization name/alias
+            safety_checks: If False, skip the pre-flight memory check
+                (trusted, pre-validated input only)
+            
+        Returns:
+            If return_result is False: Tuple of (entity_types, relationship_types)
+            If return_result is True: ConversionResult with detailed tracking
+            
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            ValueError: If the file is empty or has invalid syntax
+            MemoryError: If insufficient memory is available to parse the file
+        """
+        graph, triple_count, file_size_mb = RDFGraphParser.parse_ttl_file(
+            str(file_path),
+            force_large_file,
+            rdf_format=rdf_format,
+            safety_checks=safety_checks,
+        )
+        
+        if triple_count == 0:
+            raise ValueError("No RDF triples found in the provided content")
+        
+        return self._build_result(graph, triple_count, return_result)
+    
     def parse_ttl_with_compliance_report(
         self, 
         ttl_content: str, 
@@ -343,48 +545,15 @@ class RDFToFabricConverter:
             source_path=source_path,
         )
         
-        # Reset state (includes skipped_items and conversion_warnings)
-        self._reset_state()
-        
-        # Step 1: Extract all classes (entity types) using ClassExtractor
-        self.entity_types, class_uri_to_id = ClassExtractor.extract_classes(
-            graph, self._generate_id, self._uri_to_name
-        )
-        self.uri_to_id.update(class_uri_to_id)
-        
-        # Step 2: Extract data properties using DataPropertyExtractor
-        self.property_to_domain, prop_uri_to_id = DataPropertyExtractor.extract_data_properties(
-            graph, self.entity_types, self._generate_id, self._uri_to_name
-        )
-        self.uri_to_id.update(prop_uri_to_id)
-        
-        # Step 3: Extract object properties (relationships) using ObjectPropertyExtractor
-        self.relationship_types, rel_uri_to_id = ObjectPropertyExtractor.extract_object_properties(
-            graph, self.entity_types, self.property_to_domain,
-            self._generate_id, self._uri_to_name, self._add_skipped_item
-        )
-        self.uri_to_id.update(rel_uri_to_id)
-        
-        # Step 4: Set entity ID parts and display name properties
-        EntityIdentifierSetter.set_identifiers(self.entity_types)
-        
-        entity_list = list(self.entity_types.values())
-        relationship_list = list(self.relationship_types.values())
-        
-        logger.info(
-            f"Parsed {len(entity_list)} entity types and "
-            f"{len(relationship_list)} relationship types"
-        )
-        
-        if self.skipped_items:
-            logger.info(f"Skipped {len(self.skipped_items)} items during conversion")
+        entity_list, relationship_list = self._extract_from_graph(graph)
         
         # Create conversion result
+        skipped_items, warnings = self._take_result_lists()
         result = ConversionResult(
             entity_types=entity_list,
             relationship_types=relationship_list,
-            skipped_items=self.skipped_items.copy(),
-            warnings=self.conversion_warnings.copy(),
+            skipped_items=skipped_items,
+            warnings=warnings,
             triple_count=triple_count
         )
         
@@ -400,17 +569,17 @@ class RDFToFabricConverter:
                 # Log conversion warnings
                 for warning in report.warnings:
                     logger.warning(
-                        f"Conversion warning [{warning.impact.value}]: "
-                        f"{warning.feature} - {warning.message}"
+                        "Conversion warning [%s]: %s - %s",
+                        warning.impact.value, warning.feature, warning.message,
                     )
                 
                 # Log summary
                 logger.info(
-                    f"Compliance report: {report.total_issues} issues, "
-                    f"{len(report.warnings)} conversion warnings"
+                    "Compliance report: %d issues, %d conversion warnings",
+                    report.total_issues, len(report.warnings),
                 )
             except Exception as e:
-                logger.warning(f"Failed to generate compliance report: {e}")
+                logger.warning("Failed to generate compliance report: %s", e)
         
         return result, report
 
@@ -426,6 +595,7 @@ def parse_ttl_streaming(
     progress_callback: Optional[Callable[[int], None]] = None,
     cancellation_token: Optional[Any] = None,
     rdf_format: Optional[str] = None,
+    definition_sink: Optional[BinaryIO] = None,
 ) -> Tuple[Dict[str, Any], str, ConversionResult]:
     """
     Parse a large TTL file using streaming mode and return Fabric Ontology definition.
@@ -439,9 +609,13 @@ def parse_ttl_streaming(
         batch_size: Number of triples to process per batch (default: 10000)
         progress_callback: Optional callback for progress updates
         cancellation_token: Optional cancellation token for interruptible processing
+        definition_sink: Optional binary file to receive the definition parts
+            as JSON lines (see convert_to_fabric_definition_stream) instead
+            of collecting them in the returned dict
         
     Returns:
-        Tuple of (Fabric Ontology definition dict, ontology name, ConversionResult)
+        Tuple of (Fabric Ontology definition dict, ontology name, ConversionResult).
+        When definition_sink is given the dict's "parts" list is empty.
         
     Raises:
         FileNotFoundError: If file doesn't exist
@@ -456,6 +630,7 @@ def parse_ttl_streaming(
         id_prefix=id_prefix,
         batch_size=batch_size
     )
+    converter._hand_off_results = True
     
     result = converter.parse_ttl_streaming(
         str(validated_path),
@@ -465,14 +640,16 @@ def parse_ttl_streaming(
     )
     
     # Extract ontology name from file
-    ontology_name = validated_path.stem
-    # Clean for Fabric naming requirements
-    ontology_name = ''.join(c if c.isalnum() or c == '_' else '_' for c in ontology_name)
-    ontology_name = ontology_name[:100]
-    if ontology_name and not ontology_name[0].isalpha():
-        ontology_name = 'O_' + ontology_name
-    if not ontology_name:
-        ontology_name = "ImportedOntology"
+    ontology_name = _sanitize_ontology_name(validated_path.stem) or "ImportedOntology"
+    
+    if definition_sink is not None:
+        convert_to_fabric_definition_stream(
+            result.entity_types,
+            result.relationship_types,
+            ontology_name,
+            definition_sink,
+        )
+        return {"parts": []}, ontology_name, result
     
     definition = convert_to_fabric_definition(
         result.entity_types,
@@ -494,42 +671,30 @@ def _topological_sort_entities(entity_types: List[EntityType]) -> List[EntityTyp
     Returns:
         Sorted list with parents before children
     """
-    # Build a map of id -> entity
-    id_to_entity: Dict[str, EntityType] = {e.id: e for e in entity_types}
-    
-    # Build adjacency list (child -> parent)
-    children: Dict[str, List[str]] = {e.id: [] for e in entity_types}  # parent_id -> list of child_ids
-    
-    for entity in entity_types:
-        if entity.baseEntityTypeId and entity.baseEntityTypeId in id_to_entity:
-            children[entity.baseEntityTypeId].append(entity.id)
-    
-    # Find root entities (no parent or parent not in our set)
-    roots = [e for e in entity_types if not e.baseEntityTypeId or e.baseEntityTypeId not in id_to_entity]
-    
-    # BFS to build sorted order
-    sorted_entities = []
-    visited = set()
-    queue = [e.id for e in roots]
-    
-    while queue:
-        entity_id = queue.pop(0)
-        if entity_id in visited:
-            continue
-        visited.add(entity_id)
-        sorted_entities.append(id_to_entity[entity_id])
-        
-        # Add children to queue
-        for child_id in children[entity_id]:
-            if child_id not in visited:
-                queue.append(child_id)
-    
-    # Add any remaining entities (shouldn't happen if graph is well-formed)
-    for entity in entity_types:
-        if entity.id not in visited:
-            sorted_entities.append(entity)
-    
-    return sorted_entities
+    return FabricSerializer._topological_sort_entities(entity_types)
+
+
+@overload
+def convert_to_fabric_definition(
+    entity_types: List[EntityType],
+    relationship_types: List[RelationshipType],
+    ontology_name: str = ...,
+    skip_validation: bool = ...,
+    skip_fabric_limits: bool = ...,
+    as_bytes: Literal[False] = ...,
+) -> Dict[str, Any]: ...
+
+
+@overload
+def convert_to_fabric_definition(
+    entity_types: List[EntityType],
+    relationship_types: List[RelationshipType],
+    ontology_name: str = ...,
+    skip_validation: bool = ...,
+    skip_fabric_limits: bool = ...,
+    *,
+    as_bytes: Literal[True],
+) -> bytes: ...
 
 
 def convert_to_fabric_definition(
@@ -538,7 +703,8 @@ def convert_to_fabric_definition(
     ontology_name: str = "ImportedOntology",
     skip_validation: bool = False,
     skip_fabric_limits: bool = False,
-) -> Dict[str, Any]:
+    as_bytes: bool = False,
+) -> Union[Dict[str, Any], bytes]:
     """
     Convert parsed entity and relationship types to Fabric Ontology definition format.
     
@@ -548,38 +714,110 @@ def convert_to_fabric_definition(
         ontology_name: Name for the ontology
         skip_validation: If True, skip definition validation (not recommended)
         skip_fabric_limits: If True, skip Fabric API limits validation
+        as_bytes: If True, return the definition as compact JSON bytes
+            (encoded with orjson when installed)
+        
+    Returns:
+        Dictionary representing the Fabric Ontology definition, or its
+        JSON encoding if as_bytes is True
+        
+    Raises:
+        ValueError: If validation fails with critical errors
+    """
+    _validate_for_fabric(
+        entity_types, relationship_types, skip_validation, skip_fabric_limits
+    )
+    
+    # Delegate serialization to FabricSerializer
+    definition = FabricSerializer.create_definition(entity_types, relationship_types, ontology_name)
+    if as_bytes:
+        return dumps_compact(definition)
+    return definition
+
+
+def convert_to_fabric_definition_stream(
+    entity_types: List[EntityType],
+    relationship_types: List[RelationshipType],
+    ontology_name: str,
+    out_file: BinaryIO,
+    skip_validation: bool = False,
+    skip_fabric_limits: bool = False,
+) -> int:
+    """
+    Write the Fabric Ontology definition parts to a file as JSON lines.
+    
+    Performs the same validation as convert_to_fabric_definition, then
+    writes one part per line (NDJSON) in the same order as its "parts"
+    array, without building the full list in memory.
+    
+    Args:
+        entity_types: List of entity types
+        relationship_types: List of relationship types
+        ontology_name: Name for the ontology
+        out_file: Binary file-like object to write to
+        skip_validation: If True, skip definition validation (not recommended)
+        skip_fabric_limits: If True, skip Fabric API limits validation
         
     Returns:
-        Dictionary representing the Fabric Ontology definition
+        Number of parts written
+        
+    Raises:
+        ValueError: If validation fails with critical errors
+    """
+    _validate_for_fabric(
+        entity_types, relationship_types, skip_validation, skip_fabric_limits
+    )
+    return FabricSerializer.write_definition_parts(
+        entity_types, relationship_types, out_file, ontology_name
+    )
+
+
+def _validate_for_fabric(
+    entity_types: List[EntityType],
+    relationship_types: List[RelationshipType],
+    skip_validation: bool,
+    skip_fabric_limits: bool,
+) -> None:
+    """
+    Run definition and Fabric API limit validation before serialization.
+    
+    Args:
+        entity_types: List of entity types
+        relationship_types: List of relationship types
+        skip_validation: If True, skip definition validation
+        skip_fabric_limits: If True, skip Fabric API limits validation
         
     Raises:
         ValueError: If validation fails with critical errors
     """
     # Validate definition before creating (unless explicitly skipped)
     if not skip_validation:
-        is_valid, validation_errors = FabricDefinitionValidator.validate_definition(
-            entity_types, relationship_types
-        )
+        # Every error goes into the exception; only warning logging is
+        # skipped when WARNING is disabled
+        report_warnings = logger.isEnabledFor(logging.WARNING)
+        critical_errors: List[DefinitionValidationError] = []
+        warning_count = 0
         
-        # Log all validation issues
-        for error in validation_errors:
-            if error.level == "warning":
-                logger.warning(str(error))
-            else:
-                logger.error(str(error))
+        for issue in FabricDefinitionValidator.validate_definition_iter(
+            entity_types, relationship_types
+        ):
+            if issue.level == "warning":
+                warning_count += 1
+                if report_warnings:
+                    logger.warning("%s", issue)
+                continue
+            logger.error("%s", issue)
+            critical_errors.append(issue)
         
         # Fail on critical errors
-        if not is_valid:
-            critical_errors = [e for e in validation_errors if e.level == "error"]
+        if critical_errors:
             error_msg = "Invalid ontology definition:\n" + "\n".join(
                 f"  - {e.message}" for e in critical_errors
             )
             raise ValueError(error_msg)
         
-        if validation_errors:
-            warning_count = sum(1 for e in validation_errors if e.level == "warning")
-            if warning_count > 0:
-                logger.info(f"Definition validation passed with {warning_count} warning(s)")
+        if warning_count > 0:
+            logger.info("Definition validation passed with %d warning(s)", warning_count)
         else:
             logger.debug("Definition validation passed with no issues")
     
@@ -588,27 +826,26 @@ def convert_to_fabric_definition(
         fabric_validator = FabricLimitsValidator()
         limit_errors = fabric_validator.validate_all(entity_types, relationship_types)
         
-        # Log limit validation issues
+        # Log limit validation issues, collecting errors in the same pass
+        critical_limits = []
+        limit_warning_count = 0
         for error in limit_errors:
             if error.level == "warning":
-                logger.warning(f"Fabric limit warning: {error.message}")
+                limit_warning_count += 1
+                logger.warning("Fabric limit warning: %s", error.message)
             else:
-                logger.error(f"Fabric limit error: {error.message}")
+                critical_limits.append(error)
+                logger.error("Fabric limit error: %s", error.message)
         
         # Fail on critical limit errors
-        if fabric_validator.has_errors(limit_errors):
-            critical_errors = fabric_validator.get_errors_only(limit_errors)
+        if critical_limits:
             error_msg = "Fabric API limit exceeded:\n" + "\n".join(
-                f"  - {e.message}" for e in critical_errors
+                f"  - {e.message}" for e in critical_limits
             )
             raise ValueError(error_msg)
         
-        warnings = fabric_validator.get_warnings_only(limit_errors)
-        if warnings:
-            logger.info(f"Fabric limits check passed with {len(warnings)} warning(s)")
-    
-    # Delegate serialization to FabricSerializer
-    return FabricSerializer.create_definition(entity_types, relationship_types, ontology_name)
+        if limit_warning_count:
+            logger.info("Fabric limits check passed with %d warning(s)", limit_warning_count)
 
 
 # NOTE: InputValidator has been moved to core/validators.py
@@ -617,6 +854,131 @@ def convert_to_fabric_definition(
 # will continue to work.
 
 
+def _sanitize_ontology_name(label: str) -> str:
+    """
+    Clean a label for Fabric ontology naming requirements.
+    
+    Characters other than letters, digits and underscores become '_', the
+    result is capped at 100 characters, and names not starting with a
+    letter get an 'O_' prefix.
+    
+    Args:
+        label: Raw label or file stem
+        
+    Returns:
+        Sanitized name (empty if label is empty)
+    """
+    # One replacement per character, so truncating first is equivalent
+    name = _INVALID_NAME_CHARS.sub('_', label[:100])
+    if name and not name[0].isalpha():
+        name = 'O_' + name
+    return name
+
+
+def _extract_ontology_name(graph: Graph) -> str:
+    """
+    Derive a Fabric-safe ontology name from the owl:Ontology rdfs:label.
+    
+    Args:
+        graph: Parsed RDF graph
+        
+    Returns:
+        Sanitized label of the first owl:Ontology, or "ImportedOntology"
+    """
+    ontology = next(graph.subjects(RDF.type, OWL.Ontology), None)
+    if ontology is None:
+        return "ImportedOntology"
+    label = graph.value(ontology, RDFS.label)
+    if label is None:
+        return "ImportedOntology"
+    return _sanitize_ontology_name(str(label))
+
+
+def _parse_validated_file(
+    converter: RDFToFabricConverter,
+    validated_path: Path,
+    force_large_file: bool,
+    rdf_format: Optional[str],
+) -> ConversionResult:
+    """
+    Convert an already validated RDF file with the given converter.
+    
+    The path is handed to rdflib, so the file content is never held in
+    memory as a Python string. Files that are not valid UTF-8 are re-read
+    as latin-1, as rdflib only decodes UTF-8.
+    
+    Args:
+        converter: Converter to run (its graph attribute is populated)
+        validated_path: Path returned by InputValidator.validate_input_ttl_path
+        force_large_file: If True, skip memory safety checks for large files
+        rdf_format: Optional explicit serialization name/alias
+        
+    Returns:
+        ConversionResult for the file
+    """
+    try:
+        result = converter.parse_ttl_file(
+            validated_path,
+            force_large_file=force_large_file,
+            return_result=True,
+            rdf_format=rdf_format,
+        )
+    except UnicodeDecodeError as e:
+        logger.error("Encoding error reading %s: %s", validated_path, e)
+        # Try with different encoding; read bytes and decode once, as
+        # newline translation is not needed for RDF parsing
+        try:
+            ttl_content = validated_path.read_bytes().decode('latin-1')
+            logger.warning("Successfully read file with latin-1 encoding")
+        except Exception as e2:
+            raise ValueError(f"Unable to decode file {validated_path}: {e2}")
+        result = converter.parse_ttl(
+            ttl_content,
+            force_large_file=force_large_file,
+            return_result=True,
+            rdf_format=rdf_format,
+            source_path=validated_path,
+        )
+    return cast(ConversionResult, result)
+
+
+def _convert_file(
+    validated_path: Path,
+    id_prefix: int,
+    force_large_file: bool,
+    rdf_format: Optional[str],
+) -> Tuple[Dict[str, Any], str, ConversionResult]:
+    """
+    Parse and convert an RDF file whose inputs were already validated.
+    
+    Shared by parse_ttl_file and parse_ttl_file_with_result, which each
+    validate their inputs once.
+    
+    Args:
+        validated_path: Path returned by InputValidator.validate_input_ttl_path
+        id_prefix: Prefix returned by InputValidator.validate_id_prefix
+        force_large_file: If True, skip memory safety checks for large files
+        rdf_format: Optional explicit serialization name/alias
+        
+    Returns:
+        Tuple of (Fabric Ontology definition dict, extracted ontology name, ConversionResult)
+    """
+    format_hint = rdf_format or RDFGraphParser.infer_format_from_path(validated_path)
+    
+    converter = RDFToFabricConverter(id_prefix=id_prefix)
+    converter._hand_off_results = True
+    result = _parse_validated_file(converter, validated_path, force_large_file, format_hint)
+    ontology_name = _extract_ontology_name(cast(Graph, converter.graph))
+    
+    definition = convert_to_fabric_definition(
+        result.entity_types,
+        result.relationship_types,
+        ontology_name
+    )
+    
+    return definition, ontology_name, result
+
+
 def parse_ttl_file(
     file_path: str,
     id_prefix: int = 1000000000000,
@@ -644,34 +1006,176 @@ def parse_ttl_file(
     # Validate inputs upfront with security checks
     validated_path = InputValidator.validate_input_ttl_path(file_path)
     id_prefix = InputValidator.validate_id_prefix(id_prefix)
-    format_hint = rdf_format or RDFGraphParser.infer_format_from_path(validated_path)
     
-    try:
-        with open(validated_path, 'r', encoding='utf-8') as f:
-            ttl_content = f.read()
-    except UnicodeDecodeError as e:
-        logger.error(f"Encoding error reading {validated_path}: {e}")
-        # Try with different encoding
-        try:
-            with open(validated_path, 'r', encoding='latin-1') as f:
-                ttl_content = f.read()
-            logger.warning(f"Successfully read file with latin-1 encoding")
-        except Exception as e2:
-            raise ValueError(f"Unable to decode file {validated_path}: {e2}")
-    except PermissionError:
-        logger.error(f"Permission denied reading {validated_path}")
-        raise PermissionError(f"Permission denied: {validated_path}")
-    except Exception as e:
-        logger.error(f"Error reading file {validated_path}: {e}")
-        raise IOError(f"Error reading file: {e}")
-    
-    return parse_ttl_content(
+    definition, ontology_name, _ = _convert_file(
+        validated_path, id_prefix, force_large_file, rdf_format
+    )
+    return definition, ontology_name
+
+
+def _convert_file_job(
+    job: Tuple[Path, int, bool, Optional[str]]
+) -> Tuple[Dict[str, Any], str, ConversionResult]:
+    """Run _convert_file in a worker process (module-level so it pickles)."""
+    return _convert_file(*job)
+
+
+def parse_ttl_files(
+    file_paths: List[str],
+    id_prefix: int = 1000000000000,
+    force_large_file: bool = False,
+    rdf_format: Optional[str] = None,
+    workers: Optional[int] = None,
+) -> Iterator[Tuple[Dict[str, Any], str, ConversionResult]]:
+    """
+    Convert several TTL files, spreading them across worker processes.
+    
+    rdflib parsing is CPU-bound pure Python, so independent files convert
+    in parallel with one process each. Every worker pays for importing
+    rdflib, so a single file (or workers=1) is converted in this process.
+    Each file is converted exactly as parse_ttl_file_with_result would.
+    
+    All paths are validated and the largest file is memory-checked once
+    before any work starts. Unless force_large_file is set, the number of
+    workers is also capped so that that many copies of the largest file
+    fit within the memory a single check allows.
+    
+    Args:
+        file_paths: Paths to the TTL files
+        id_prefix: Base prefix for generating unique IDs (per file)
+        force_large_file: If True, skip memory safety checks for large files
+        rdf_format: Optional explicit serialization name/alias for all files
+        workers: Maximum number of worker processes (default: CPU count)
+        
+    Yields:
+        (definition dict, ontology name, ConversionResult) per file, in
+        the order of file_paths
+        
+    Raises:
+        MemoryError: If the largest file fails the memory pre-check
+        The first error raised while converting a file, when its result
+        is reached
+    """
+    validated_paths = [InputValidator.validate_input_ttl_path(p) for p in file_paths]
+    id_prefix = InputValidator.validate_id_prefix(id_prefix)
+    jobs = [(path, id_prefix, force_large_file, rdf_format) for path in validated_paths]
+    if not jobs:
+        return
+    
+    max_workers = min(workers or os.cpu_count() or 1, len(jobs))
+    if max_workers > 1 and not force_large_file:
+        largest_mb = max(path.stat().st_size for path in validated_paths) / (1024 * 1024)
+        can_proceed, memory_message = MemoryManager.check_memory_available(largest_mb)
+        if not can_proceed:
+            logger.error("Memory check failed: %s", memory_message)
+            raise MemoryError(memory_message)
+        memory_cap = MemoryManager.max_concurrent_parses(largest_mb)
+        if memory_cap is not None and memory_cap < max_workers:
+            logger.info(
+                "Limiting to %d worker processes to fit available memory", memory_cap
+            )
+            max_workers = memory_cap
+    
+    if max_workers <= 1:
+        for job in jobs:
+            yield _convert_file_job(job)
+        return
+    
+    logger.info("Converting %d files with %d worker processes", len(jobs), max_workers)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        yield from executor.map(_convert_file_job, jobs)
+
+
+def _convert_content(
+    ttl_content: str,
+    id_prefix: int,
+    force_large_file: bool,
+    rdf_format: Optional[str],
+    source_path: Optional[Union[str, Path]],
+    cache: Optional[ConversionCache] = None,
+) -> Tuple[Dict[str, Any], str, ConversionResult]:
+    """
+    Convert validated TTL content, optionally through a ConversionCache.
+    
+    Args:
+        ttl_content: Validated TTL content
+        id_prefix: Validated base prefix for generating unique IDs
+        force_large_file: If True, skip memory safety checks for large files
+        rdf_format: Optional explicit serialization name/alias
+        source_path: Optional path the content was read from
+        cache: Optional cache keyed on the content digest and options
+        
+    Returns:
+        Tuple of (Fabric Ontology definition dict, extracted ontology name, ConversionResult)
+    """
+    key: Optional[_ContentCacheKey] = None
+    if cache is not None and len(ttl_content) <= cache.max_chars:
+        digest = hashlib.blake2b(ttl_content.encode('utf-8', 'surrogatepass')).digest()
+        key = (
+            digest,
+            id_prefix,
+            force_large_file,
+            rdf_format,
+            str(source_path) if source_path is not None else None,
+        )
+        cached = cache.get(key)
+        if cached is not None:
+            logger.debug("Reusing cached conversion for identical TTL content")
+            return cached
+    
+    converter = RDFToFabricConverter(id_prefix=id_prefix)
+    converter._hand_off_results = True
+    
+    # Get detailed conversion result
+    result = converter.parse_ttl(
         ttl_content,
-        id_prefix,
         force_large_file=force_large_file,
-        rdf_format=format_hint,
-        source_path=str(validated_path),
+        return_result=True,
+        rdf_format=rdf_format,
+        source_path=source_path,
+    )
+    
+    # Type assertion for mypy
+    assert isinstance(result, ConversionResult), "Expected ConversionResult when return_result=True"
+    
+    # Extract ontology name from the graph the converter already parsed
+    ontology_name = _extract_ontology_name(cast(Graph, converter.graph))
+    
+    definition = convert_to_fabric_definition(
+        result.entity_types, 
+        result.relationship_types, 
+        ontology_name
     )
+    
+    converted = (definition, ontology_name, result)
+    if cache is not None and key is not None:
+        cache.put(key, converted, len(ttl_content))
+    return converted
+
+
+@overload
+def parse_ttl_content(
+    ttl_content: str,
+    id_prefix: int = ...,
+    force_large_file: bool = ...,
+    rdf_format: Optional[str] = ...,
+    source_path: Optional[Union[str, Path]] = ...,
+    as_bytes: Literal[False] = ...,
+    cache: Optional[ConversionCache] = ...,
+) -> Tuple[Dict[str, Any], str]: ...
+
+
+@overload
+def parse_ttl_content(
+    ttl_content: str,
+    id_prefix: int = ...,
+    force_large_file: bool = ...,
+    rdf_format: Optional[str] = ...,
+    source_path: Optional[Union[str, Path]] = ...,
+    *,
+    as_bytes: Literal[True],
+    cache: Optional[ConversionCache] = ...,
+) -> Tuple[bytes, str]: ...
 
 
 def parse_ttl_content(
@@ -680,17 +1184,24 @@ def parse_ttl_content(
     force_large_file: bool = False,
     rdf_format: Optional[str] = None,
     source_path: Optional[Union[str, Path]] = None,
-) -> Tuple[Dict[str, Any], str]:
+    as_bytes: bool = False,
+    cache: Optional[ConversionCache] = None,
+) -> Tuple[Union[Dict[str, Any], bytes], str]:
     """
     Parse TTL content and return the Fabric Ontology definition.
     
+    When a ConversionCache is passed, repeated calls with identical content
+    and options reuse the cached conversion instead of parsing again.
+    
     Args:
         ttl_content: TTL content as string
         id_prefix: Base prefix for generating unique IDs
         force_large_file: If True, skip memory safety checks for large files
+        as_bytes: If True, return the definition as compact JSON bytes
+        cache: Optional ConversionCache for reusing repeated conversions
         
     Returns:
-        Tuple of (Fabric Ontology definition dict, extracted ontology name)
+        Tuple of (Fabric Ontology definition dict or JSON bytes, extracted ontology name)
         
     Raises:
         ValueError: If content is empty or invalid
@@ -701,57 +1212,65 @@ def parse_ttl_content(
     ttl_content = InputValidator.validate_ttl_content(ttl_content)
     id_prefix = InputValidator.validate_id_prefix(id_prefix)
     
-    converter = RDFToFabricConverter(id_prefix=id_prefix)
-    entity_types, relationship_types = converter.parse_ttl(
-        ttl_content,
-        force_large_file=force_large_file,
-        rdf_format=rdf_format,
-        source_path=source_path,
+    definition, ontology_name, _ = _convert_content(
+        ttl_content, id_prefix, force_large_file, rdf_format, source_path, cache
     )
-    
-    # Try to extract ontology name from the TTL
-    graph = Graph()
-    format_name = RDFGraphParser.resolve_format(rdf_format, source_path)
-    graph.parse(data=ttl_content, format=format_name)
-    
-    ontology_name = "ImportedOntology"
-    for s in graph.subjects(RDF.type, OWL.Ontology):
-        # Try to get label
-        labels = list(graph.objects(s, RDFS.label))
-        if labels:
-            label = str(labels[0])
-            # Clean up for Fabric naming requirements
-            ontology_name = ''.join(c if c.isalnum() or c == '_' else '_' for c in label)
-            ontology_name = ontology_name[:100]  # Max 100 chars
-            if ontology_name and not ontology_name[0].isalpha():
-                ontology_name = 'O_' + ontology_name
-        break
-    
-    definition = convert_to_fabric_definition(entity_types, relationship_types, ontology_name)
-    
+    if as_bytes:
+        return dumps_compact(definition), ontology_name
     return definition, ontology_name
 
 
+@overload
+def parse_ttl_with_result(
+    ttl_content: str,
+    id_prefix: int = ...,
+    force_large_file: bool = ...,
+    rdf_format: Optional[str] = ...,
+    source_path: Optional[Union[str, Path]] = ...,
+    as_bytes: Literal[False] = ...,
+    cache: Optional[ConversionCache] = ...,
+) -> Tuple[Dict[str, Any], str, ConversionResult]: ...
+
+
+@overload
+def parse_ttl_with_result(
+    ttl_content: str,
+    id_prefix: int = ...,
+    force_large_file: bool = ...,
+    rdf_format: Optional[str] = ...,
+    source_path: Optional[Union[str, Path]] = ...,
+    *,
+    as_bytes: Literal[True],
+    cache: Optional[ConversionCache] = ...,
+) -> Tuple[bytes, str, ConversionResult]: ...
+
+
 def parse_ttl_with_result(
     ttl_content: str, 
     id_prefix: int = 1000000000000, 
     force_large_file: bool = False,
     rdf_format: Optional[str] = None,
     source_path: Optional[Union[str, Path]] = None,
-) -> Tuple[Dict[str, Any], str, ConversionResult]:
+    as_bytes: bool = False,
+    cache: Optional[ConversionCache] = None,
+) -> Tuple[Union[Dict[str, Any], bytes], str, ConversionResult]:
     """
     Parse TTL content and return the Fabric Ontology definition with detailed conversion result.
     
     This function provides enhanced error recovery by tracking skipped items
-    and warnings during conversion.
+    and warnings during conversion. When a ConversionCache is passed,
+    repeated calls with identical content and options reuse the cached
+    conversion (warnings are not logged again on a cache hit).
     
     Args:
         ttl_content: TTL content as string
         id_prefix: Base prefix for generating unique IDs
         force_large_file: If True, skip memory safety checks for large files
+        as_bytes: If True, return the definition as compact JSON bytes
+        cache: Optional ConversionCache for reusing repeated conversions
         
     Returns:
-        Tuple of (Fabric Ontology definition dict, extracted ontology name, ConversionResult)
+        Tuple of (Fabric Ontology definition dict or JSON bytes, extracted ontology name, ConversionResult)
         
     Raises:
         ValueError: If content is empty or invalid
@@ -762,44 +1281,11 @@ def parse_ttl_with_result(
     ttl_content = InputValidator.validate_ttl_content(ttl_content)
     id_prefix = InputValidator.validate_id_prefix(id_prefix)
     
-    converter = RDFToFabricConverter(id_prefix=id_prefix)
-    
-    # Get detailed conversion result
-    result = converter.parse_ttl(
-        ttl_content,
-        force_large_file=force_large_file,
-        return_result=True,
-        rdf_format=rdf_format,
-        source_path=source_path,
-    )
-    
-    # Type assertion for mypy
-    assert isinstance(result, ConversionResult), "Expected ConversionResult when return_result=True"
-    
-    # Try to extract ontology name from the TTL
-    graph = Graph()
-    format_name = RDFGraphParser.resolve_format(rdf_format, source_path)
-    graph.parse(data=ttl_content, format=format_name)
-    
-    ontology_name = "ImportedOntology"
-    for s in graph.subjects(RDF.type, OWL.Ontology):
-        # Try to get label
-        labels = list(graph.objects(s, RDFS.label))
-        if labels:
-            label = str(labels[0])
-            # Clean up for Fabric naming requirements
-            ontology_name = ''.join(c if c.isalnum() or c == '_' else '_' for c in label)
-            ontology_name = ontology_name[:100]  # Max 100 chars
-            if ontology_name and not ontology_name[0].isalpha():
-                ontology_name = 'O_' + ontology_name
-        break
-    
-    definition = convert_to_fabric_definition(
-        result.entity_types, 
-        result.relationship_types, 
-        ontology_name
+    definition, ontology_name, result = _convert_content(
+        ttl_content, id_prefix, force_large_file, rdf_format, source_path, cache
     )
-    
+    if as_bytes:
+        return dumps_compact(definition), ontology_name, result
     return definition, ontology_name, result
 
 
@@ -833,31 +1319,5 @@ def parse_ttl_file_with_result(
     # Validate inputs upfront with security checks
     validated_path = InputValidator.validate_input_ttl_path(file_path)
     id_prefix = InputValidator.validate_id_prefix(id_prefix)
-    format_hint = rdf_format or RDFGraphParser.infer_format_from_path(validated_path)
     
-    try:
-        with open(validated_path, 'r', encoding='utf-8') as f:
-            ttl_content = f.read()
-    except UnicodeDecodeError as e:
-        logger.error(f"Encoding error reading {validated_path}: {e}")
-        # Try with different encoding
-        try:
-            with open(validated_path, 'r', encoding='latin-1') as f:
-                ttl_content = f.read()
-            logger.warning(f"Successfully read file with latin-1 encoding")
-        except Exception as e2:
-            raise ValueError(f"Unable to decode file {validated_path}: {e2}")
-    except PermissionError:
-        logger.error(f"Permission denied reading {validated_path}")
-        raise PermissionError(f"Permission denied: {validated_path}")
-    except Exception as e:
-        logger.error(f"Error reading file {validated_path}: {e}")
-        raise IOError(f"Error reading file: {e}")
-    
-    return parse_ttl_with_result(
-        ttl_content,
-        id_prefix,
-        force_large_file=force_large_file,
-        rdf_format=format_hint,
-        source_path=str(validated_path),
-    )
+    return _convert_file(validated_path, id_prefix, force_large_file, rdf_format)
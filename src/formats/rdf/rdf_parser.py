@@ -10,6 +10,7 @@ Components:
 """
 
 import logging
+import time
 from pathlib import Path
 from typing import Optional, Tuple, Union
 
@@ -25,6 +26,13 @@ try:
 except ImportError:
     PSUTIL_AVAILABLE = False
 
+# Check for the Oxigraph-backed rdflib store (registers the "Oxigraph" plugin)
+try:
+    import oxrdflib  # noqa: F401
+    OXRDFLIB_AVAILABLE = True
+except ImportError:
+    OXRDFLIB_AVAILABLE = False
+
 
 class MemoryManager:
     """
@@ -48,11 +56,18 @@ class MemoryManager:
     
     LOAD_FACTOR = 0.7  # Only use 70% of available memory as safe threshold
     
+    # Readings of available memory are reused within the same one-second
+    # bucket so a single parse (pre-flight check plus before/after status
+    # logs) only queries psutil once.
+    _available_cache: Optional[Tuple[int, float]] = None
+    
     @staticmethod
     def get_available_memory_mb() -> float:
         """
         Get available system memory in MB.
         
+        The value is cached for the current one-second interval.
+        
         Returns:
             Available memory in MB, or infinity if detection fails.
         """
@@ -60,12 +75,18 @@ class MemoryManager:
             logger.warning("psutil not available - cannot check memory. Install with: pip install psutil")
             return float('inf')  # Assume unlimited if we can't check
         
+        bucket = int(time.monotonic())
+        cached = MemoryManager._available_cache
+        if cached is not None and cached[0] == bucket:
+            return cached[1]
+        
         try:
             mem_info = psutil.virtual_memory()
             available_mb = mem_info.available / (1024 * 1024)
+            MemoryManager._available_cache = (bucket, available_mb)
             return available_mb
         except Exception as e:
-            logger.warning(f"Could not determine available memory: {e}")
+            logger.warning("Could not determine available memory: %s", e)
             return MemoryManager.MIN_AVAILABLE_MB
     
     @staticmethod
@@ -150,6 +171,28 @@ class MemoryManager:
             f"estimated usage ~{estimated_usage_mb:.0f}MB of {available_mb:.0f}MB available"
         )
     
+    @classmethod
+    def max_concurrent_parses(cls, file_size_mb: float) -> Optional[int]:
+        """
+        Estimate how many files of a given size can be parsed at once.
+        
+        Uses the same per-file estimate and safe threshold as
+        check_memory_available, so N concurrent parses together stay
+        within the memory one check would allow.
+        
+        Args:
+            file_size_mb: Size of the largest file in MB.
+            
+        Returns:
+            Maximum number of concurrent parses (at least 1), or None if
+            memory cannot be checked.
+        """
+        available_mb = cls.get_available_memory_mb()
+        estimated_usage_mb = file_size_mb * cls.MEMORY_MULTIPLIER
+        if available_mb == float('inf') or estimated_usage_mb <= 0:
+            return None
+        return max(1, int(available_mb * cls.LOAD_FACTOR // estimated_usage_mb))
+    
     @classmethod
     def log_memory_status(cls, context: str = "") -> None:
         """
@@ -158,7 +201,8 @@ class MemoryManager:
         Args:
             context: Optional context string to include in log message.
         """
-        if not PSUTIL_AVAILABLE:
+        # Skip the psutil queries entirely unless the message will be emitted
+        if not PSUTIL_AVAILABLE or not logger.isEnabledFor(logging.DEBUG):
             return
         
         try:
@@ -166,11 +210,11 @@ class MemoryManager:
             available_mb = cls.get_available_memory_mb()
             prefix = f"[{context}] " if context else ""
             logger.debug(
-                f"{prefix}Memory status: Process using {process_mb:.0f}MB, "
-                f"System available: {available_mb:.0f}MB"
+                "%sMemory status: Process using %.0fMB, System available: %.0fMB",
+                prefix, process_mb, available_mb,
             )
         except Exception as e:
-            logger.debug(f"Could not log memory status: {e}")
+            logger.debug("Could not log memory status: %s", e)
 
 
 class RDFGraphParser:
@@ -205,6 +249,18 @@ class RDFGraphParser:
         "hext",
     }
 
+    # Opt-in: set to True to back graphs with the native Oxigraph store
+    # when oxrdflib is installed. Triples then come back in store order,
+    # so entity and property IDs may be assigned in a different order.
+    use_native_store = False
+
+    # Formats whose rdflib parsers need a formula-aware store; these
+    # always use rdflib's in-memory store
+    FORMULA_FORMATS = {
+        "n3",
+        "trig",
+    }
+
     FORMAT_ALIASES = {
         "ttl": "turtle",
         "turtle": "turtle",
@@ -277,31 +333,70 @@ class RDFGraphParser:
         """Return True when the serialization may contain multiple named graphs."""
         return format_name in cls.DATASET_FORMATS
 
+    @classmethod
+    def _native_store_enabled(cls, format_name: str) -> bool:
+        """Return True when graphs for this format should use the Oxigraph store."""
+        return (
+            OXRDFLIB_AVAILABLE
+            and cls.use_native_store
+            and format_name not in cls.FORMULA_FORMATS
+        )
+
     @classmethod
     def _create_graph(cls, format_name: str) -> Graph:
         """Instantiate the correct rdflib graph implementation for a format."""
+        store = "Oxigraph" if cls._native_store_enabled(format_name) else "default"
         if cls._is_dataset_format(format_name):
-            return ConjunctiveGraph()
-        return Graph()
+            return ConjunctiveGraph(store=store)
+        return Graph(store=store)
     
+    # Chunk size (in characters) used when counting UTF-8 bytes of
+    # non-ASCII content, so the whole buffer is never encoded at once.
+    _SIZE_CHUNK_CHARS = 1 << 20
+
+    @staticmethod
+    def _content_size_mb(content: Union[str, bytes]) -> float:
+        """
+        Return the UTF-8 size of RDF content in MB.
+
+        Bytes are measured directly. ASCII strings have one byte per
+        character; other strings are encoded chunk by chunk.
+        """
+        if isinstance(content, bytes) or content.isascii():
+            size = len(content)
+        else:
+            step = RDFGraphParser._SIZE_CHUNK_CHARS
+            size = sum(
+                len(content[i:i + step].encode('utf-8', 'surrogatepass'))
+                for i in range(0, len(content), step)
+            )
+        return size / (1024 * 1024)
+
     @staticmethod
     def parse_ttl_content(
-        ttl_content: str,
+        ttl_content: Union[str, bytes],
         force_large_file: bool = False,
         rdf_format: Optional[str] = None,
         source_path: Optional[Union[str, Path]] = None,
+        safety_checks: bool = True,
     ) -> Tuple[Graph, int, float]:
         """
         Parse RDF content into an RDF graph with memory safety checks.
         
         Args:
-            ttl_content: The RDF content as a string
+            ttl_content: The RDF content as a string or UTF-8 bytes
             force_large_file: If True, skip memory safety checks for large files
             rdf_format: Optional explicit serialization name/alias
             source_path: Optional source path used for format inference
+            safety_checks: If False, skip exact sizing, the pre-flight
+                memory check and memory status logging.
+                Intended for trusted, pre-validated input only; the caller
+                loses protection against out-of-memory crashes.
             
         Returns:
-            Tuple of (parsed Graph, triple count, content size in MB)
+            Tuple of (parsed Graph, triple count, content size in MB).
+            With safety_checks disabled the size is the length of the
+            content in MB, which undercounts multi-byte characters.
             
         Raises:
             ValueError: If TTL content is empty or has invalid syntax
@@ -309,33 +404,37 @@ class RDFGraphParser:
         """
         logger.info("Parsing RDF content%s...", f" ({rdf_format})" if rdf_format else "")
         
-        if not ttl_content or not ttl_content.strip():
+        if not ttl_content or ttl_content.isspace():
             raise ValueError("Empty TTL content provided")
         
-        # Check size before parsing
-        content_size_mb = len(ttl_content.encode('utf-8')) / (1024 * 1024)
-        logger.info(f"RDF content size: {content_size_mb:.2f} MB")
-        
-        # Pre-flight memory check to prevent crashes
-        can_proceed, memory_message = MemoryManager.check_memory_available(
-            content_size_mb, 
-            force=force_large_file
-        )
-        
-        if not can_proceed:
-            logger.error(f"Memory check failed: {memory_message}")
-            raise MemoryError(memory_message)
-        
-        logger.info(f"Memory check: {memory_message}")
-        
-        if content_size_mb > 100:
-            logger.warning(
-                f"Large RDF content detected ({content_size_mb:.1f} MB). "
-                "Parsing may take several minutes."
+        if safety_checks:
+            # Check size before parsing
+            content_size_mb = RDFGraphParser._content_size_mb(ttl_content)
+            logger.info("RDF content size: %.2f MB", content_size_mb)
+            
+            # Pre-flight memory check to prevent crashes
+            can_proceed, memory_message = MemoryManager.check_memory_available(
+                content_size_mb, 
+                force=force_large_file
             )
-        
-        # Log memory before parsing
-        MemoryManager.log_memory_status("Before parsing")
+            
+            if not can_proceed:
+                logger.error("Memory check failed: %s", memory_message)
+                raise MemoryError(memory_message)
+            
+            logger.info("Memory check: %s", memory_message)
+            
+            if content_size_mb > 100:
+                logger.warning(
+                    "Large RDF content detected (%.1f MB). "
+                    "Parsing may take several minutes.",
+                    content_size_mb,
+                )
+            
+            # Log memory before parsing
+            MemoryManager.log_memory_status("Before parsing")
+        else:
+            content_size_mb = len(ttl_content) / (1024 * 1024)
         
         # Determine serialization format
         format_name = RDFGraphParser.resolve_format(rdf_format, source_path)
@@ -352,11 +451,12 @@ class RDFGraphParser:
                 f"Original error: {e}"
             )
         except Exception as e:
-            logger.error(f"Failed to parse RDF content: {e}")
+            logger.error("Failed to parse RDF content: %s", e)
             raise ValueError(f"Invalid RDF/TTL syntax: {e}")
         
         # Log memory after parsing
-        MemoryManager.log_memory_status("After parsing")
+        if safety_checks:
+            MemoryManager.log_memory_status("After parsing")
         
         triple_count = len(graph)
         if RDFGraphParser._is_dataset_format(format_name):
@@ -365,13 +465,13 @@ class RDFGraphParser:
             except Exception:
                 context_count = 0
             logger.info(
-                f"Successfully parsed dataset with {triple_count} quads "
-                f"across {context_count or 'unknown'} graph contexts "
-                f"({content_size_mb:.1f} MB)"
+                "Successfully parsed dataset with %d quads "
+                "across %s graph contexts (%.1f MB)",
+                triple_count, context_count or 'unknown', content_size_mb,
             )
         else:
             logger.info(
-                f"Successfully parsed {triple_count} triples ({content_size_mb:.1f} MB)"
+                "Successfully parsed %d triples (%.1f MB)", triple_count, content_size_mb
             )
         if triple_count == 0:
             logger.warning("Parsed graph is empty - no triples found")
@@ -379,8 +479,9 @@ class RDFGraphParser:
 
         if triple_count > 100000:
             logger.warning(
-                f"Large ontology detected ({triple_count} triples). "
-                "Processing may take several minutes."
+                "Large ontology detected (%d triples). "
+                "Processing may take several minutes.",
+                triple_count,
             )
         
         return graph, triple_count, content_size_mb
@@ -390,6 +491,7 @@ class RDFGraphParser:
         file_path: str,
         force_large_file: bool = False,
         rdf_format: Optional[str] = None,
+        safety_checks: bool = True,
     ) -> Tuple[Graph, int, float]:
         """
         Parse an RDF file into an RDF graph with memory safety checks.
@@ -398,12 +500,16 @@ class RDFGraphParser:
             file_path: Path to the RDF file
             force_large_file: If True, skip memory safety checks for large files
             rdf_format: Optional explicit serialization name/alias
+            safety_checks: If False, skip the pre-flight memory check and
+                memory status logging (trusted input only)
             
         Returns:
             Tuple of (parsed Graph, triple count, file size in MB)
             
         Raises:
             FileNotFoundError: If file doesn't exist
+            PermissionError: If the file is not readable
+            UnicodeDecodeError: If the file is not valid UTF-8
             ValueError: If file has invalid syntax
             MemoryError: If insufficient memory is available
         """
@@ -412,22 +518,23 @@ class RDFGraphParser:
             raise FileNotFoundError(f"File not found: {file_path}")
         
         file_size_mb = path.stat().st_size / (1024 * 1024)
-        logger.info(f"File size: {file_size_mb:.2f} MB")
-        
-        # Pre-flight memory check
-        can_proceed, memory_message = MemoryManager.check_memory_available(
-            file_size_mb, 
-            force=force_large_file
-        )
-        
-        if not can_proceed:
-            logger.error(f"Memory check failed: {memory_message}")
-            raise MemoryError(memory_message)
+        logger.info("File size: %.2f MB", file_size_mb)
         
-        logger.info(f"Memory check: {memory_message}")
-        
-        # Log memory before parsing
-        MemoryManager.log_memory_status("Before parsing")
+        if safety_checks:
+            # Pre-flight memory check
+            can_proceed, memory_message = MemoryManager.check_memory_available(
+                file_size_mb, 
+                force=force_large_file
+            )
+            
+            if not can_proceed:
+                logger.error("Memory check failed: %s", memory_message)
+                raise MemoryError(memory_message)
+            
+            logger.info("Memory check: %s", memory_message)
+            
+            # Log memory before parsing
+            MemoryManager.log_memory_status("Before parsing")
         
         # Resolve serialization format
         format_name = RDFGraphParser.resolve_format(rdf_format, path)
@@ -443,12 +550,19 @@ class RDFGraphParser:
                 f"Try splitting the ontology into smaller files or increasing available memory. "
                 f"Original error: {e}"
             )
+        except UnicodeDecodeError:
+            # Let callers retry with another encoding
+            raise
+        except PermissionError:
+            logger.error("Permission denied reading %s", file_path)
+            raise PermissionError(f"Permission denied: {file_path}")
         except Exception as e:
-            logger.error(f"Failed to parse RDF file: {e}")
+            logger.error("Failed to parse RDF file: %s", e)
             raise ValueError(f"Invalid RDF/TTL syntax: {e}")
         
         # Log memory after parsing
-        MemoryManager.log_memory_status("After parsing")
+        if safety_checks:
+            MemoryManager.log_memory_status("After parsing")
         
         triple_count = len(graph)
         if RDFGraphParser._is_dataset_format(format_name):
@@ -457,13 +571,13 @@ class RDFGraphParser:
             except Exception:
                 context_count = 0
             logger.info(
-                f"Successfully parsed dataset with {triple_count} quads "
-                f"across {context_count or 'unknown'} graph contexts "
-                f"({file_size_mb:.1f} MB)"
+                "Successfully parsed dataset with %d quads "
+                "across %s graph contexts (%.1f MB)",
+                triple_count, context_count or 'unknown', file_size_mb,
             )
         else:
             logger.info(
-                f"Successfully parsed {triple_count} triples ({file_size_mb:.1f} MB)"
+                "Successfully parsed %d triples (%.1f MB)", triple_count, file_size_mb
             )
         
         return graph, triple_count, file_size_mb
@@ -7,10 +7,13 @@ better separation of concerns.
 """
 
 import logging
+import sys
+from collections import defaultdict
+from itertools import chain
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
-from rdflib import URIRef
+from rdflib import Graph, Literal, RDF, RDFS, URIRef
 
 from src.shared.models import (
     EntityType,
@@ -18,12 +21,15 @@ from src.shared.models import (
     ConversionResult,
     SkippedItem,
 )
-from .rdf_parser import RDFGraphParser
+from .rdf_parser import MemoryManager, RDFGraphParser
 from .property_extractor import (
     ClassExtractor,
     DataPropertyExtractor,
     ObjectPropertyExtractor,
     EntityIdentifierSetter,
+    classify_rdf_properties,
+    GraphIndex,
+    RelationshipKey,
 )
 from .type_mapper import TypeMapper
 from .uri_utils import URIUtils
@@ -33,14 +39,64 @@ logger = logging.getLogger(__name__)
 # Type alias
 FabricType = str
 
+# Serializations whose rdflib parsers insert through Graph.add, so a
+# _SchemaGraph sees every triple. N3 is not one of them: its parser
+# writes to a formula-aware graph and bypasses Graph.add
+_SCHEMA_FILTER_FORMATS = frozenset({"turtle", "nt", "xml"})
+
+# Literal-valued predicates the extractors still read; rdf:first keeps
+# literal enumerations inside class expressions intact
+_KEPT_LITERAL_PREDICATES = frozenset({RDFS.comment, RDFS.label, RDF.first})
+
+# Names listed per item type in the end-of-conversion skip summary;
+# every skipped item is still logged individually at DEBUG
+SKIP_SUMMARY_EXAMPLES = 3
+
+
+class _SchemaGraph(Graph):
+    """
+    Graph that drops literal-valued instance data while it is parsed.
+    
+    Extraction only reads class and property declarations, rdf:type and
+    object-property usage, so data values never need to be held in memory.
+    Every parsed triple is counted, and on_batch is called every
+    batch_size triples so callers can report progress or cancel mid-parse.
+    
+    triples_seen counts triples as the parser emits them, so a triple
+    stated twice in the source is counted twice; the dropped literals are
+    never stored, so distinct triples cannot be counted without keeping
+    them.
+    """
+    
+    def __init__(
+        self,
+        batch_size: int,
+        on_batch: Optional[Callable[[int], None]] = None,
+        store: str = "default",
+    ):
+        super().__init__(store=store)
+        self.triples_seen = 0
+        self._batch_size = batch_size
+        self._on_batch = on_batch
+    
+    def add(self, triple):
+        self.triples_seen += 1
+        if self._on_batch is not None and self.triples_seen % self._batch_size == 0:
+            self._on_batch(self.triples_seen)
+        if isinstance(triple[2], Literal) and triple[1] not in _KEPT_LITERAL_PREDICATES:
+            return self
+        return super().add(triple)
+
 
 class StreamingRDFConverter:
     """
     Memory-efficient streaming converter for large ontologies.
     
     This converter processes RDF files in phases to minimize memory usage:
-    1. First pass: Discover and extract class declarations (lightweight)
-    2. Second pass: Process properties in batches
+    1. Parse: literal-valued instance data is dropped as triples arrive,
+       with progress and cancellation checked every batch_size triples
+    2. Discover and extract class declarations (lightweight)
+    3. Process properties and relationships
     
     Use this converter for ontologies larger than 500MB or when memory is limited.
     For smaller files, the standard RDFToFabricConverter is recommended as it's faster.
@@ -80,13 +136,15 @@ class StreamingRDFConverter:
         
         # Storage for extracted entities
         self.entity_types: Dict[str, EntityType] = {}
-        self.relationship_types: Dict[str, RelationshipType] = {}
-        self.uri_to_id: Dict[str, str] = {}
+        self.relationship_types: Dict[RelationshipKey, RelationshipType] = {}
+        self.uri_to_id: Dict[Union[str, RelationshipKey], str] = {}
         self.property_to_domain: Dict[str, str] = {}
         
         # Error recovery tracking
         self.skipped_items: List[SkippedItem] = []
         self.conversion_warnings: List[str] = []
+        # Set by one-shot callers that discard the converter afterwards
+        self._hand_off_results = False
         
         # Statistics
         self.triples_processed = 0
@@ -106,10 +164,29 @@ class StreamingRDFConverter:
         self.classes_found = 0
         self.properties_found = 0
     
+    def _take_result_lists(self) -> Tuple[List[SkippedItem], List[str]]:
+        """
+        Get the skipped items and warnings for a ConversionResult.
+        
+        Converters created by the module-level parse functions are
+        discarded after one conversion, so they hand their lists over
+        instead of copying them; otherwise the caller gets copies.
+        """
+        if self._hand_off_results:
+            skipped, warnings = self.skipped_items, self.conversion_warnings
+            self.skipped_items, self.conversion_warnings = [], []
+            return skipped, warnings
+        return self.skipped_items.copy(), self.conversion_warnings.copy()
+
     def _generate_id(self) -> str:
-        """Generate a unique ID for entities and properties."""
+        """
+        Generate a unique ID for entities and properties.
+        
+        IDs are interned so every table keyed by them, and any equal ID
+        string produced later, shares one object.
+        """
         self.id_counter += 1
-        return str(self.id_prefix + self.id_counter)
+        return sys.intern(str(self.id_prefix + self.id_counter))
     
     def _uri_to_name(self, uri: URIRef) -> str:
         """Extract a clean name from a URI."""
@@ -129,8 +206,21 @@ class StreamingRDFConverter:
             reason=reason,
             uri=uri
         ))
-        logger.debug(f"Skipped {item_type} '{name}': {reason}")
+        logger.debug("Skipped %s '%s': %s", item_type, name, reason)
     
+    def _flush_skip_summary(self) -> None:
+        """Log one summary warning per skipped item type."""
+        names_by_type: Dict[str, List[str]] = defaultdict(list)
+        for item in self.skipped_items:
+            names_by_type[item.item_type].append(item.name)
+        for item_type, names in names_by_type.items():
+            examples = ", ".join(names[:SKIP_SUMMARY_EXAMPLES])
+            if len(names) > SKIP_SUMMARY_EXAMPLES:
+                examples += ", ..."
+            logger.warning(
+                "Skipped %d %s items (examples: %s)", len(names), item_type, examples
+            )
+
     def _add_warning(self, message: str) -> None:
         """Track a warning during conversion."""
         self.conversion_warnings.append(message)
@@ -163,14 +253,17 @@ class StreamingRDFConverter:
             rdf_format: Optional RDF format hint (e.g., 'turtle', 'xml', 'n3')
             
         Returns:
-            ConversionResult with entity types, relationship types, and metadata
+            ConversionResult with entity types, relationship types, and metadata.
+            For Turtle, N-Triples and RDF/XML, triple_count is the number of
+            statements parsed (a repeated statement counts each time); for
+            other formats it is the number of distinct triples in the graph.
             
         Raises:
             FileNotFoundError: If file doesn't exist
             ValueError: If file has invalid syntax
             OperationCancelledException: If cancelled via token
         """
-        logger.info(f"Starting streaming parse of {file_path}")
+        logger.info("Starting streaming parse of %s", file_path)
         self._reset_state()
         
         # Validate file exists
@@ -179,29 +272,38 @@ class StreamingRDFConverter:
             raise FileNotFoundError(f"File not found: {file_path}")
         
         file_size_mb = path.stat().st_size / (1024 * 1024)
-        logger.info(f"File size: {file_size_mb:.2f} MB")
+        logger.info("File size: %.2f MB", file_size_mb)
         
         # Check for cancellation
         if cancellation_token and hasattr(cancellation_token, 'throw_if_cancelled'):
             cancellation_token.throw_if_cancelled()
         
-        # Parse the TTL file using RDFGraphParser
-        graph, total_triples, _ = RDFGraphParser.parse_ttl_file(
-            file_path,
-            rdf_format=rdf_format,
-        )
-        
         if progress_callback:
             progress_callback(0)
         
+        # Parse, dropping instance data values where the parser allows it
+        format_name = RDFGraphParser.resolve_format(rdf_format, path)
+        if format_name in _SCHEMA_FILTER_FORMATS:
+            graph, total_triples = self._parse_schema_graph(
+                path, format_name, file_size_mb, progress_callback, cancellation_token
+            )
+        else:
+            graph, total_triples, _ = RDFGraphParser.parse_ttl_file(
+                file_path,
+                rdf_format=format_name,
+            )
+        self.triples_processed = total_triples
+        
+        # Graph lookups are shared by all phases
+        graph_index = GraphIndex(graph)
+        
         # Phase 1: Extract classes using ClassExtractor
         logger.info("Phase 1: Discovering classes...")
         self.entity_types, class_uri_to_id = ClassExtractor.extract_classes(
-            graph, self._generate_id, self._uri_to_name
+            graph, self._generate_id, self._uri_to_name, graph_index=graph_index
         )
-        self.uri_to_id.update(class_uri_to_id)
         self.classes_found = len(self.entity_types)
-        logger.info(f"Phase 1 complete: Found {self.classes_found} classes")
+        logger.info("Phase 1 complete: Found %d classes", self.classes_found)
         
         # Check for cancellation
         if cancellation_token and hasattr(cancellation_token, 'throw_if_cancelled'):
@@ -209,12 +311,15 @@ class StreamingRDFConverter:
         
         # Phase 2: Process properties using DataPropertyExtractor
         logger.info("Phase 2: Processing properties...")
+        # rdf:Property classification is shared by phases 2 and 3
+        rdf_property_ranges = classify_rdf_properties(graph, graph_index)
         self.property_to_domain, prop_uri_to_id = DataPropertyExtractor.extract_data_properties(
-            graph, self.entity_types, self._generate_id, self._uri_to_name
+            graph, self.entity_types, self._generate_id, self._uri_to_name,
+            rdf_property_ranges=rdf_property_ranges,
+            graph_index=graph_index,
         )
-        self.uri_to_id.update(prop_uri_to_id)
         self.properties_found = len(self.property_to_domain)
-        logger.info(f"Phase 2 complete: Found {self.properties_found} data properties")
+        logger.info("Phase 2 complete: Found %d data properties", self.properties_found)
         
         # Check for cancellation
         if cancellation_token and hasattr(cancellation_token, 'throw_if_cancelled'):
@@ -224,10 +329,16 @@ class StreamingRDFConverter:
         logger.info("Phase 3: Processing relationships...")
         self.relationship_types, rel_uri_to_id = ObjectPropertyExtractor.extract_object_properties(
             graph, self.entity_types, self.property_to_domain,
-            self._generate_id, self._uri_to_name, self._add_skipped_item
+            self._generate_id, self._uri_to_name, self._add_skipped_item,
+            rdf_property_ranges=rdf_property_ranges,
+            graph_index=graph_index,
         )
-        self.uri_to_id.update(rel_uri_to_id)
-        logger.info(f"Phase 3 complete: Found {len(self.relationship_types)} relationships")
+        # Merge the per-step lookups in one pass instead of growing
+        # uri_to_id step by step
+        self.uri_to_id = dict(chain(
+            class_uri_to_id.items(), prop_uri_to_id.items(), rel_uri_to_id.items()
+        ))
+        logger.info("Phase 3 complete: Found %d relationships", len(self.relationship_types))
         
         # Phase 4: Set entity identifiers using EntityIdentifierSetter
         logger.info("Phase 4: Setting entity identifiers...")
@@ -240,21 +351,83 @@ class StreamingRDFConverter:
         relationship_list = list(self.relationship_types.values())
         
         logger.info(
-            f"Streaming parse complete: {len(entity_list)} entity types, "
-            f"{len(relationship_list)} relationship types"
+            "Streaming parse complete: %d entity types, %d relationship types",
+            len(entity_list), len(relationship_list),
         )
         
-        if self.skipped_items:
-            logger.info(f"Skipped {len(self.skipped_items)} items during conversion")
+        self._flush_skip_summary()
         
+        skipped_items, warnings = self._take_result_lists()
         return ConversionResult(
             entity_types=entity_list,
             relationship_types=relationship_list,
-            skipped_items=self.skipped_items.copy(),
-            warnings=self.conversion_warnings.copy(),
+            skipped_items=skipped_items,
+            warnings=warnings,
             triple_count=total_triples
         )
     
+    def _parse_schema_graph(
+        self,
+        path: Path,
+        format_name: str,
+        file_size_mb: float,
+        progress_callback: Optional[Callable[[int], None]],
+        cancellation_token: Optional[Any],
+    ) -> Tuple[Graph, int]:
+        """
+        Parse a file into a _SchemaGraph, reporting progress per batch.
+        
+        Args:
+            path: Path to the RDF file
+            format_name: Resolved rdflib serialization name
+            file_size_mb: File size used for the memory pre-check
+            progress_callback: Optional callback with the triples parsed so far
+            cancellation_token: Optional token checked after every batch
+            
+        Returns:
+            Tuple of (filtered graph, number of triples parsed, including
+            repeated statements)
+        """
+        can_proceed, memory_message = MemoryManager.check_memory_available(file_size_mb)
+        if not can_proceed:
+            logger.error("Memory check failed: %s", memory_message)
+            raise MemoryError(memory_message)
+        
+        throw_if_cancelled = getattr(cancellation_token, 'throw_if_cancelled', None)
+        cancelled: List[Exception] = []
+        
+        def on_batch(seen: int) -> None:
+            if progress_callback:
+                progress_callback(seen)
+            if throw_if_cancelled is not None:
+                try:
+                    throw_if_cancelled()
+                except Exception as exc:
+                    cancelled.append(exc)
+                    raise
+        
+        store = "Oxigraph" if RDFGraphParser._native_store_enabled(format_name) else "default"
+        graph = _SchemaGraph(self.batch_size, on_batch, store=store)
+        try:
+            graph.parse(str(path), format=format_name)
+        except MemoryError as e:
+            raise MemoryError(
+                f"Insufficient memory while parsing RDF file ({file_size_mb:.1f} MB). "
+                f"Original error: {e}"
+            )
+        except Exception as e:
+            if cancelled:
+                # Surface the token's exception even if the parser wrapped it
+                raise cancelled[0]
+            logger.error("Failed to parse RDF file: %s", e)
+            raise ValueError(f"Invalid RDF/TTL syntax: {e}")
+        
+        logger.info(
+            "Parsed %d triples, kept %d schema and usage triples",
+            graph.triples_seen, len(graph),
+        )
+        return graph, graph.triples_seen
+    
     def get_statistics(self) -> Dict[str, Any]:
         """
         Get statistics from the last conversion.
@@ -16,6 +16,9 @@ logger = logging.getLogger(__name__)
 # Fabric type literals
 FabricType = str  # One of: "String", "Boolean", "DateTime", "BigInt", "Double"
 
+# Namespace prefix shared by all XSD datatype URIs
+XSD_PREFIX: str = str(XSD)
+
 # XSD type to Fabric value type mapping
 XSD_TO_FABRIC_TYPE: Dict[str, FabricType] = {
     # String types
@@ -158,11 +161,11 @@ class TypeMapper:
         for xsd_types, fabric_type in TYPE_HIERARCHY:
             if any(t in types_found for t in xsd_types):
                 type_str = str(types_found) if len(types_found) > 1 else next(iter(types_found))
-                logger.info(f"Resolved datatype union to {fabric_type} from types: {type_str}")
+                logger.info("Resolved datatype union to %s from types: %s", fabric_type, type_str)
                 return cast(FabricType, fabric_type), f"union: selected {fabric_type} from {type_str}"
         
         # Fallback to String for unknown XSD types
-        logger.warning(f"Datatype union contains unsupported XSD types: {types_found}, defaulting to String")
+        logger.warning("Datatype union contains unsupported XSD types: %s, defaulting to String", types_found)
         return "String", f"union: unsupported types {types_found}, defaulted to String"
     
     @classmethod
@@ -194,7 +197,7 @@ class TypeMapper:
             for target in targets:
                 if target in XSD_TO_FABRIC_TYPE:
                     types_found.add(target)
-                elif str(target).startswith(str(XSD)):
+                elif target.startswith(XSD_PREFIX):
                     # Handle other XSD types not in our mapping
                     types_found.add(target)
         
@@ -206,7 +209,7 @@ class TypeMapper:
                     types_found.add(type_str)
         
         if not types_found:
-            logger.warning(f"Could not resolve any XSD types in datatype union: {union_node}")
+            logger.warning("Could not resolve any XSD types in datatype union: %s", union_node)
             return "String", "union: no types found, defaulted to String"
         
         return cls.resolve_type_union(types_found)
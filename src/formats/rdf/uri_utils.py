@@ -8,9 +8,12 @@ Extracted from RDFToFabricConverter for Single Responsibility Principle.
 """
 
 import logging
+from functools import lru_cache
 from typing import Optional
 from rdflib import URIRef
 
+from src.shared.utilities.naming import INVALID_NAME_CHARS as _INVALID_NAME_CHARS
+
 logger = logging.getLogger(__name__)
 
 
@@ -52,6 +55,28 @@ class URIUtils:
             logger.warning("Empty URI string, using default name")
             return f'Unknown_{fallback_counter}'
         
+        name = URIUtils._name_for_uri(uri_str)
+        
+        # Handle empty extraction
+        if name is None:
+            logger.warning("Could not extract name from URI: %s", uri_str)
+            return f'Entity_{fallback_counter}'
+        
+        return name
+    
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _name_for_uri(uri_str: str) -> Optional[str]:
+        """
+        Extract and sanitize the local name of a non-empty URI string.
+        
+        The result depends only on the URI, so it is memoized; the same URI
+        is typically named several times per conversion. Counter-based
+        fallbacks are left to the caller.
+        
+        Returns:
+            The sanitized name, or None if the URI has no local name
+        """
         # Try to get the fragment (after #)
         if '#' in uri_str:
             name = uri_str.split('#')[-1]
@@ -60,13 +85,12 @@ class URIUtils:
         else:
             name = uri_str
         
-        # Handle empty extraction
         if not name:
-            logger.warning(f"Could not extract name from URI: {uri_str}")
-            return f'Entity_{fallback_counter}'
+            return None
         
-        # Sanitize the name for Fabric requirements
-        return URIUtils.sanitize_name(name, fallback_counter)
+        # Sanitize the name for Fabric requirements. A non-empty name
+        # always sanitizes to a non-empty result, so no fallback is used.
+        return URIUtils.sanitize_name(name)
     
     @staticmethod
     def sanitize_name(name: str, fallback_counter: int = 0) -> str:
@@ -89,10 +113,10 @@ class URIUtils:
             return f'Entity_{fallback_counter}'
         
         # Replace invalid characters with underscores
-        cleaned = ''.join(c if c.isalnum() or c == '_' else '_' for c in name)
+        cleaned = _INVALID_NAME_CHARS.sub('_', name)
         
         if not cleaned:
-            logger.warning(f"Name produced empty cleaned result: {name}")
+            logger.warning("Name produced empty cleaned result: %s", name)
             return f'Entity_{fallback_counter}'
         
         # Ensure starts with a letter
@@ -139,4 +163,4 @@ class URIUtils:
         if not name[0].isalpha():
             return False
         
-        return all(c.isalnum() or c == '_' for c in name)
+        return _INVALID_NAME_CHARS.search(name) is None
@@ -12,7 +12,7 @@ if TYPE_CHECKING:
     from .fabric_types import EntityType, RelationshipType
 
 
-@dataclass
+@dataclass(slots=True)
 class SkippedItem:
     """
     Represents an item that was skipped during conversion.
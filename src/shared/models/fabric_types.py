@@ -13,7 +13,7 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class EntityTypeProperty:
     """
     Represents a property of an entity type in Fabric Ontology.
@@ -57,7 +57,7 @@ class EntityTypeProperty:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class EntityType:
     """
     Represents an entity type in Fabric Ontology.
@@ -118,7 +118,7 @@ class EntityType:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class RelationshipEnd:
     """
     Represents one end (source or target) of a relationship.
@@ -133,7 +133,7 @@ class RelationshipEnd:
         return {"entityTypeId": self.entityTypeId}
 
 
-@dataclass
+@dataclass(slots=True)
 class RelationshipType:
     """
     Represents a relationship type in Fabric Ontology.
@@ -5,6 +5,7 @@ This module provides shared infrastructure for all format plugins:
 - Type mapping registry for converting source types to Fabric types
 - ID generator for consistent entity ID generation
 - Unified validation models
+- Name sanitization pattern shared by the converters
 
 Usage:
     from common import get_type_registry, get_id_generator, ValidationResult
@@ -26,6 +27,7 @@ from .validation import (
     Severity,
     IssueCategory,
 )
+from .naming import INVALID_NAME_CHARS
 
 __all__ = [
     # Type Registry
@@ -41,4 +43,6 @@ __all__ = [
     "ValidationIssue",
     "Severity",
     "IssueCategory",
+    # Naming
+    "INVALID_NAME_CHARS",
 ]
@@ -0,0 +1,17 @@
+"""
+Naming helpers shared by the format converters.
+
+Fabric names allow only letters, digits and underscores, so every format
+plugin sanitizes source names the same way.
+
+Usage:
+    from src.shared.utilities.naming import INVALID_NAME_CHARS
+    
+    safe_name = INVALID_NAME_CHARS.sub('_', name)
+"""
+
+import re
+
+# Matches any character that is not alphanumeric or underscore. For str
+# patterns, \W is exactly "not (c.isalnum() or c == '_')", Unicode included.
+INVALID_NAME_CHARS = re.compile(r'\W')
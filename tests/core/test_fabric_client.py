@@ -976,6 +976,49 @@ class TestStreamingParserWithFiles:
         assert len(progress_values) >= 1
         assert progress_values[-1] == result.triple_count
     
+    def test_instance_literals_not_retained(self, simple_ttl_content):
+        """Test that data values are counted but not kept in the parsed graph."""
+        content = simple_ttl_content + """
+        :alice a :Person ; :name "Alice" ; :age 42 ; :worksFor :acme .
+        :acme a :Organization .
+        """
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.ttl', delete=False, encoding='utf-8') as f:
+            f.write(content)
+            temp_path = f.name
+        
+        try:
+            progress_values = []
+            converter = StreamingRDFConverter(batch_size=2)
+            result = converter.parse_ttl_streaming(temp_path, progress_callback=progress_values.append)
+            
+            from rdflib import Graph
+            assert result.triple_count == len(Graph().parse(temp_path, format="turtle"))
+            assert 2 in progress_values
+            assert len(result.entity_types) == 2
+            assert [rt.name for rt in result.relationship_types] == ["worksFor"]
+        finally:
+            os.unlink(temp_path)
+    
+    def test_cancellation_during_parse(self, temp_ttl_file):
+        """Test that a cancelled token stops parsing mid-file."""
+        from src.core.services.cancellation import CancellationToken, OperationCancelledException
+        
+        token = CancellationToken()
+        seen = []
+        
+        def cancel_on_progress(n):
+            seen.append(n)
+            token.cancel()
+        
+        converter = StreamingRDFConverter(batch_size=1)
+        with pytest.raises(OperationCancelledException):
+            converter.parse_ttl_streaming(
+                temp_ttl_file,
+                progress_callback=cancel_on_progress,
+                cancellation_token=token,
+            )
+        assert seen == [0, 1]
+    
     def test_file_not_found_raises(self):
         """Test that FileNotFoundError is raised for missing files."""
         converter = StreamingRDFConverter()
@@ -1349,6 +1392,21 @@ class TestSampleOntologiesStreaming:
         assert isinstance(result, ConversionResult)
         assert result.success_rate > 0
 
+    def test_n3_ontology_counts_triples(self, samples_dir):
+        """Test streaming parser reports triples and progress for N3 input."""
+        n3_file = samples_dir / "sample_iot_ontology.n3"
+        if not n3_file.exists():
+            pytest.skip("IoT N3 sample not found")
+
+        converter = StreamingRDFConverter()
+        progress = []
+        result = converter.parse_ttl_streaming(str(n3_file), progress_callback=progress.append)
+
+        assert result.triple_count == 65
+        assert converter.triples_processed == 65
+        assert progress[-1] == 65
+        assert len(result.entity_types) > 0
+
 
 @pytest.mark.unit
 class TestStreamingThreshold:
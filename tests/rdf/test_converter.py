@@ -23,6 +23,8 @@ from src.rdf import (
     RelationshipEnd,
     parse_ttl_file,
     parse_ttl_content,
+    parse_ttl_with_result,
+    ConversionCache,
     convert_to_fabric_definition,
     FabricDefinitionValidator,
     DefinitionValidationError
@@ -85,7 +87,307 @@ class TestRDFConverter:
         # Should have 1 relationship type
         assert len(relationship_types) == 1
         assert relationship_types[0].name == "worksFor"
-    
+
+    def test_parse_ttl_file_matches_content(self, converter, simple_ttl, tmp_path):
+        """Test parsing directly from a file gives the same result as parse_ttl"""
+        ttl_file = tmp_path / "simple.ttl"
+        ttl_file.write_text(simple_ttl, encoding="utf-8")
+
+        result = converter.parse_ttl_file(ttl_file, return_result=True)
+        entity_types, relationship_types = RDFToFabricConverter().parse_ttl(simple_ttl)
+
+        assert {et.name for et in result.entity_types} == {et.name for et in entity_types}
+        assert [rt.name for rt in result.relationship_types] == [rt.name for rt in relationship_types]
+        assert result.triple_count > 0
+
+    def test_parse_ttl_file_falls_back_to_latin1(self, tmp_path):
+        """Test that non-UTF-8 files are still converted via latin-1"""
+        ttl_file = tmp_path / "latin1.ttl"
+        ttl_file.write_bytes(
+            b"@prefix : <http://example.org/> .\n"
+            b"@prefix owl: <http://www.w3.org/2002/07/owl#> .\n"
+            b"@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .\n"
+            b": a owl:Ontology ; rdfs:label \"Caf\xe9\" .\n"
+            b":Machine a owl:Class .\n"
+        )
+
+        definition, name = parse_ttl_file(str(ttl_file))
+
+        assert name == "Café"
+        assert any("EntityTypes" in part["path"] for part in definition["parts"])
+
+    def test_parse_ttl_files_matches_serial_conversion(self, tmp_path, simple_ttl):
+        """Test that parallel file conversion yields per-file results in order"""
+        from src.rdf import parse_ttl_files
+
+        paths = []
+        for i in range(3):
+            ttl_file = tmp_path / f"onto{i}.ttl"
+            ttl_file.write_text(simple_ttl + f"\n:Extra{i} a owl:Class .\n", encoding="utf-8")
+            paths.append(str(ttl_file))
+
+        parallel = list(parse_ttl_files(paths, workers=2))
+        serial = list(parse_ttl_files(paths, workers=1))
+
+        assert [definition for definition, _, _ in parallel] == [parse_ttl_file(p)[0] for p in paths]
+        assert [name for _, name, _ in parallel] == [name for _, name, _ in serial]
+        assert [len(r.entity_types) for _, _, r in parallel] == [3, 3, 3]
+
+    def test_parse_ttl_files_caps_workers_by_memory(self, tmp_path, simple_ttl):
+        """Test that the worker count is limited by one aggregate memory check"""
+        from unittest.mock import patch
+        from src.formats.rdf import rdf_converter
+        from src.formats.rdf.rdf_parser import MemoryManager
+
+        paths = []
+        for i in range(3):
+            ttl_file = tmp_path / f"onto{i}.ttl"
+            ttl_file.write_text(simple_ttl, encoding="utf-8")
+            paths.append(str(ttl_file))
+
+        with patch.object(MemoryManager, "max_concurrent_parses", return_value=1), \
+                patch.object(rdf_converter, "ProcessPoolExecutor") as pool:
+            results = list(rdf_converter.parse_ttl_files(paths, workers=3))
+
+        pool.assert_not_called()
+        assert len(results) == 3
+
+        with patch.object(MemoryManager, "check_memory_available", return_value=(False, "too big")):
+            with pytest.raises(MemoryError, match="too big"):
+                next(rdf_converter.parse_ttl_files(paths, workers=3))
+
+    def test_safety_checks_can_be_disabled(self, converter, simple_ttl):
+        """Test that disabling safety checks skips the memory pre-check"""
+        from unittest.mock import patch
+        from src.formats.rdf.rdf_parser import MemoryManager
+
+        with patch.object(MemoryManager, "check_memory_available") as check:
+            entity_types, _ = converter.parse_ttl(simple_ttl, safety_checks=False)
+            assert len(entity_types) == 2
+            check.assert_not_called()
+
+        with pytest.raises(ValueError, match="Empty TTL content"):
+            converter.parse_ttl("  \n\t ", safety_checks=False)
+
+    def test_rdf_property_range_classification(self, converter):
+        """Test that plain rdf:Property declarations split by range kind"""
+        ttl = """
+        @prefix : <http://example.org/> .
+        @prefix rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .
+        @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+        @prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
+
+        :Person a rdfs:Class .
+        :Company a rdfs:Class .
+        :label a rdf:Property ; rdfs:domain :Person ; rdfs:range xsd:string .
+        :employer a rdf:Property ; rdfs:domain :Person ; rdfs:range :Company .
+        :untyped a rdf:Property ; rdfs:domain :Person .
+        """
+        entity_types, relationship_types = converter.parse_ttl(ttl)
+        person = next(et for et in entity_types if et.name == "Person")
+
+        assert [p.name for p in person.properties] == ["label"]
+        assert [rt.name for rt in relationship_types] == ["employer"]
+
+    def test_result_lists_copied_unless_handed_off(self, converter):
+        """Test that skipped items are copied for kept converters and moved otherwise"""
+        ttl = """
+        @prefix : <http://example.org/> .
+        @prefix owl: <http://www.w3.org/2002/07/owl#> .
+
+        :Person a owl:Class .
+        :unused a owl:ObjectProperty .
+        """
+        result = converter.parse_ttl(ttl, return_result=True)
+        assert [item.name for item in result.skipped_items] == ["unused"]
+        assert converter.skipped_items == result.skipped_items
+        assert converter.skipped_items is not result.skipped_items
+
+        converter._hand_off_results = True
+        handed_off = converter.parse_ttl(ttl, return_result=True)
+        assert [item.name for item in handed_off.skipped_items] == ["unused"]
+        assert converter.skipped_items == []
+
+    def test_skipped_items_logged_as_summary(self, converter, caplog):
+        """Test that skipped items produce one warning per item type"""
+        import logging
+
+        ttl = """
+        @prefix : <http://example.org/> .
+        @prefix owl: <http://www.w3.org/2002/07/owl#> .
+
+        :Person a owl:Class .
+        """ + "".join(f":unused{i} a owl:ObjectProperty .\n" for i in range(5))
+
+        with caplog.at_level(logging.WARNING, logger="src.formats.rdf.rdf_converter"):
+            converter.parse_ttl(ttl)
+
+        assert len(converter.skipped_items) == 5
+        skip_warnings = [r.getMessage() for r in caplog.records if "Skipped" in r.getMessage()]
+        assert len(skip_warnings) == 1
+        assert skip_warnings[0].startswith("Skipped 5 relationship items (examples: unused")
+        assert skip_warnings[0].endswith(", ...)")
+
+    def test_relationship_domain_and_range_inferred_from_usage(self, converter):
+        """Test that object properties without domain/range use instance data"""
+        ttl = """
+        @prefix : <http://example.org/> .
+        @prefix owl: <http://www.w3.org/2002/07/owl#> .
+
+        :Person a owl:Class .
+        :Company a owl:Class .
+        :worksFor a owl:ObjectProperty .
+        :unused a owl:ObjectProperty .
+
+        :alice a :Person ; :worksFor :acme .
+        :acme a :Company .
+        """
+        entity_types, relationship_types = converter.parse_ttl(ttl)
+        ids = {et.name: et.id for et in entity_types}
+
+        assert [rt.name for rt in relationship_types] == ["worksFor"]
+        assert relationship_types[0].source.entityTypeId == ids["Person"]
+        assert relationship_types[0].target.entityTypeId == ids["Company"]
+        assert [item.name for item in converter.skipped_items] == ["unused"]
+        assert list(converter.relationship_types) == [(
+            "http://example.org/worksFor",
+            "http://example.org/Person",
+            "http://example.org/Company",
+        )]
+
+    def test_inferred_domain_uses_most_common_subject_type(self, converter):
+        """Test that usage inference picks the most frequent subject type"""
+        ttl = """
+        @prefix : <http://example.org/> .
+        @prefix owl: <http://www.w3.org/2002/07/owl#> .
+
+        :Contractor a owl:Class .
+        :Person a owl:Class .
+        :Company a owl:Class .
+        :worksFor a owl:ObjectProperty .
+
+        :zed a :Contractor ; :worksFor :acme .
+        :alice a :Person ; :worksFor :acme .
+        :bob a :Person ; :worksFor :acme .
+        :carol a :Person ; :worksFor :acme .
+        :acme a :Company .
+        """
+        entity_types, relationship_types = converter.parse_ttl(ttl)
+        ids = {et.name: et.id for et in entity_types}
+
+        assert len(relationship_types) == 1
+        assert relationship_types[0].source.entityTypeId == ids["Person"]
+        assert relationship_types[0].target.entityTypeId == ids["Company"]
+
+    def test_set_identifiers_prefers_id_property(self):
+        """Test entityIdParts and displayNamePropertyId selection"""
+        from src.formats.rdf.property_extractor import EntityIdentifierSetter
+
+        with_id = EntityType(id="1", name="Customer", properties=[
+            EntityTypeProperty(id="10", name="weight", valueType="Double"),
+            EntityTypeProperty(id="11", name="code", valueType="String"),
+            EntityTypeProperty(id="12", name="customerId", valueType="BigInt"),
+            EntityTypeProperty(id="13", name="fullName", valueType="String"),
+        ])
+        without_id = EntityType(id="2", name="Tag", properties=[
+            EntityTypeProperty(id="20", name="weight", valueType="Double"),
+            EntityTypeProperty(id="21", name="code", valueType="String"),
+        ])
+        EntityIdentifierSetter.set_identifiers({"a": with_id, "b": without_id})
+
+        assert with_id.entityIdParts == ["12"]
+        assert with_id.displayNamePropertyId == "13"
+        assert without_id.entityIdParts == ["21"]
+        assert without_id.displayNamePropertyId == "21"
+
+    def test_progress_skips_wrapper_below_threshold(self):
+        """Test that small collections are iterated without a tqdm wrapper"""
+        from src.formats.rdf.property_extractor import _progress
+
+        items = {"a", "b", "c"}
+        assert _progress(items, 10, desc="Processing relationships") is items
+
+    def test_graph_index_matches_graph_lookups(self):
+        """Test that GraphIndex returns graph.objects results in order and memoizes them"""
+        from rdflib import Graph, URIRef
+        from rdflib.namespace import RDFS
+        from src.formats.rdf.property_extractor import GraphIndex
+
+        ex = "http://example.org/"
+        graph = Graph()
+        graph.add((URIRef(ex + "b"), RDFS.domain, URIRef(ex + "Y")))
+        graph.add((URIRef(ex + "a"), RDFS.domain, URIRef(ex + "X")))
+        graph.add((URIRef(ex + "a"), RDFS.domain, URIRef(ex + "Y")))
+
+        index = GraphIndex(graph)
+        prop = URIRef(ex + "a")
+        assert index.objects(prop, RDFS.domain) == tuple(graph.objects(prop, RDFS.domain))
+        assert index.value(prop, RDFS.domain) == graph.value(prop, RDFS.domain)
+        assert index.objects(prop, RDFS.domain) is index.objects(prop, RDFS.domain)
+        assert index.value(URIRef(ex + "missing"), RDFS.range) is None
+
+    def test_graph_index_memoizes_class_targets(self):
+        """Test that GraphIndex.class_targets matches ClassResolver and is cached"""
+        from rdflib import Graph, URIRef
+        from rdflib.namespace import RDFS
+        from src.formats.rdf.class_resolver import ClassResolver
+        from src.formats.rdf.property_extractor import GraphIndex
+
+        graph = Graph()
+        graph.parse(data="""
+        @prefix : <http://example.org/> .
+        @prefix owl: <http://www.w3.org/2002/07/owl#> .
+        @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+
+        :owns rdfs:domain [ owl:unionOf ( :Person :Company ) ] .
+        """, format="turtle")
+        union = graph.value(URIRef("http://example.org/owns"), RDFS.domain)
+
+        index = GraphIndex(graph)
+        assert list(index.class_targets(union)) == ClassResolver.resolve_class_targets(graph, union)
+        assert index.class_targets(union) is index.class_targets(union)
+
+    def test_circular_inheritance_skips_parents(self, converter):
+        """Test that parents leading into a subclass cycle are not assigned"""
+        ttl = """
+        @prefix : <http://example.org/> .
+        @prefix owl: <http://www.w3.org/2002/07/owl#> .
+        @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+
+        :A a owl:Class ; rdfs:subClassOf :B .
+        :B a owl:Class ; rdfs:subClassOf :A .
+        :C a owl:Class ; rdfs:subClassOf :A .
+        :D a owl:Class ; rdfs:subClassOf :E .
+        :E a owl:Class .
+        """
+        entity_types, _ = converter.parse_ttl(ttl)
+        by_name = {et.name: et for et in entity_types}
+
+        assert by_name["A"].baseEntityTypeId is None
+        assert by_name["B"].baseEntityTypeId is None
+        assert by_name["C"].baseEntityTypeId is None
+        assert by_name["D"].baseEntityTypeId == by_name["E"].id
+
+    def test_deep_inheritance_chain_beyond_recursion_limit(self, converter):
+        """Test that very deep subclass chains are handled without recursion"""
+        depth = sys.getrecursionlimit() + 500
+        lines = [
+            "@prefix : <http://example.org/> .",
+            "@prefix owl: <http://www.w3.org/2002/07/owl#> .",
+            "@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .",
+            ":C0 a owl:Class .",
+        ]
+        lines.extend(f":C{i} a owl:Class ; rdfs:subClassOf :C{i - 1} ." for i in range(1, depth))
+        # Close a cycle far down the chain; everything below it must lose its parent
+        lines.append(":C1 rdfs:subClassOf :C5 .")
+
+        entity_types, _ = converter.parse_ttl("\n".join(lines))
+        by_name = {et.name: et for et in entity_types}
+
+        assert by_name["C0"].baseEntityTypeId is None
+        assert by_name[f"C{depth - 1}"].baseEntityTypeId is None
+        assert by_name["C1"].baseEntityTypeId == by_name["C0"].id
+
     def test_empty_ttl(self, converter):
         """Test handling of empty TTL content"""
         with pytest.raises(ValueError, match="Empty TTL content"):
@@ -115,7 +417,18 @@ class TestRDFConverter:
         uri = URIRef("http://example.org/ontology/v1/Customer")
         name = converter._uri_to_name(uri)
         assert name == "Customer"
-    
+
+        # Punctuation is replaced; Unicode letters and digits are kept
+        uri = URIRef("http://example.org/Café-Größe.v2")
+        name = converter._uri_to_name(uri)
+        assert name == "Café_Größe_v2"
+
+        # Fallback names still follow the counter when the URI is seen again
+        from src.formats.rdf.uri_utils import URIUtils
+        uri = URIRef("http://example.org/ontology/")
+        assert URIUtils.uri_to_name(uri, 3) == "Entity_3"
+        assert URIUtils.uri_to_name(uri, 4) == "Entity_4"
+
     def test_fabric_name_compliance(self, converter):
         """Test that generated names comply with Fabric requirements"""
         from rdflib import URIRef
@@ -200,7 +513,81 @@ class TestRDFConverter:
         # Should have entity type definitions
         entity_parts = [p for p in definition["parts"] if "EntityTypes" in p["path"]]
         assert len(entity_parts) == len(entity_types)
-    
+
+    def test_topological_sort_orders_parents_first(self):
+        """Test that parents precede children and cyclic entities are kept"""
+        from src.formats.rdf.fabric_serializer import FabricSerializer
+
+        child = EntityType(id="3", name="Child", baseEntityTypeId="2")
+        parent = EntityType(id="2", name="Parent", baseEntityTypeId="1")
+        root = EntityType(id="1", name="Root")
+        loop_a = EntityType(id="8", name="LoopA", baseEntityTypeId="9")
+        loop_b = EntityType(id="9", name="LoopB", baseEntityTypeId="8")
+        external = EntityType(id="5", name="External", baseEntityTypeId="404")
+
+        ordered = FabricSerializer._topological_sort_entities(
+            [child, loop_a, parent, external, root, loop_b]
+        )
+
+        assert [e.id for e in ordered] == ["5", "1", "2", "3", "8", "9"]
+
+    def test_topological_sort_reuses_cached_order(self):
+        """Test that large hierarchies reuse the cached order for equal links"""
+        from src.formats.rdf import fabric_serializer
+        from src.formats.rdf.fabric_serializer import FabricSerializer
+
+        count = fabric_serializer.SORT_CACHE_MIN_ENTITIES + 50
+
+        def chain():
+            # Children listed before parents
+            return [
+                EntityType(id=str(i), name=f"E{i}", baseEntityTypeId=str(i - 1) if i else None)
+                for i in reversed(range(count))
+            ]
+
+        fabric_serializer._cached_topological_order.cache_clear()
+        first = FabricSerializer._topological_sort_entities(chain())
+        second_input = chain()
+        second = FabricSerializer._topological_sort_entities(second_input)
+
+        assert [e.id for e in first] == [str(i) for i in range(count)]
+        assert [e.id for e in second] == [e.id for e in first]
+        assert all(any(e is x for x in second_input) for e in second[:3])
+        assert fabric_serializer._cached_topological_order.cache_info().hits == 1
+
+    def test_generated_ids_are_interned(self, converter):
+        """Test that entity and relationship ids are interned strings"""
+        import sys
+
+        ttl = """
+        @prefix : <http://example.org/> .
+        @prefix owl: <http://www.w3.org/2002/07/owl#> .
+        @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+
+        :Asset a owl:Class .
+        :Pump a owl:Class ; rdfs:subClassOf :Asset .
+        :feeds a owl:ObjectProperty ; rdfs:domain :Pump ; rdfs:range :Asset .
+        """
+        entity_types, relationship_types = converter.parse_ttl(ttl)
+
+        # Equal strings built independently only resolve to the same
+        # object through sys.intern if the converter interned the ids
+        for item in entity_types + relationship_types:
+            assert sys.intern("".join(list(item.id))) is item.id
+
+    def test_payload_encoding_matches_stdlib(self, monkeypatch):
+        """Test that payloads decode the same with and without orjson"""
+        from src.formats.rdf import fabric_serializer
+        from src.formats.rdf.fabric_serializer import FabricSerializer
+
+        data = {"name": "Café", "ids": [1, 2], "nested": {"flag": True, "none": None}}
+        encoded = FabricSerializer.encode_payload(data)
+        monkeypatch.setattr(fabric_serializer, "ORJSON_AVAILABLE", False)
+        fallback = FabricSerializer.encode_payload(data)
+
+        assert FabricSerializer.decode_payload(encoded) == data
+        assert FabricSerializer.decode_payload(fallback) == data
+
     def test_parse_ttl_file(self, converter, tmp_path):
         """Test parsing from file"""
         # Create a temporary TTL file
@@ -610,6 +997,100 @@ class TestConversionAccuracy:
             assert part["payloadType"] == "InlineBase64"
 
 
+    def test_ontology_name_uses_single_parse(self, monkeypatch):
+        """Test that the ontology label is read from the converter's graph"""
+        from rdflib import Graph
+
+        ttl = """
+        @prefix : <http://example.org/> .
+        @prefix owl: <http://www.w3.org/2002/07/owl#> .
+        @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+
+        : a owl:Ontology ; rdfs:label "3D Plant Model" .
+        :Machine a owl:Class .
+        """
+        calls = []
+        original_parse = Graph.parse
+
+        def counting_parse(self, *args, **kwargs):
+            calls.append(1)
+            return original_parse(self, *args, **kwargs)
+
+        monkeypatch.setattr(Graph, "parse", counting_parse)
+        _, ontology_name = parse_ttl_content(ttl)
+
+        assert ontology_name == "O_3D_Plant_Model"
+        assert len(calls) == 1
+
+
+    def test_sanitize_ontology_name(self):
+        """Test ontology name cleanup matches the per-character rules"""
+        from src.formats.rdf.rdf_converter import _sanitize_ontology_name
+
+        def reference(label):
+            name = ''.join(c if c.isalnum() or c == '_' else '_' for c in label)[:100]
+            return 'O_' + name if name and not name[0].isalpha() else name
+
+        for label in ["Plant Model", "3D Plant", "Café – 数据 v2", "x" * 150 + "!", "", "_private"]:
+            assert _sanitize_ontology_name(label) == reference(label)
+
+    def test_repeated_content_uses_cached_conversion(self, monkeypatch, simple_ttl):
+        """Test that identical content is converted once and returned as copies"""
+        from rdflib import Graph
+
+        calls = []
+        original_parse = Graph.parse
+
+        def counting_parse(self, *args, **kwargs):
+            calls.append(1)
+            return original_parse(self, *args, **kwargs)
+
+        monkeypatch.setattr(Graph, "parse", counting_parse)
+        cache = ConversionCache()
+        definition, name, result = parse_ttl_with_result(simple_ttl, cache=cache)
+        definition["parts"].clear()
+        result.entity_types.clear()
+
+        again, again_name, again_result = parse_ttl_with_result(simple_ttl, cache=cache)
+        assert len(calls) == 1
+        assert again_name == name
+        assert again["parts"]
+        assert again_result.entity_types
+
+        parse_ttl_with_result(simple_ttl, id_prefix=2000000000000, cache=cache)
+        assert len(calls) == 2
+
+    def test_conversions_not_cached_by_default(self, monkeypatch, simple_ttl):
+        """Test that repeated content is re-converted without a cache"""
+        from rdflib import Graph
+
+        calls = []
+        original_parse = Graph.parse
+
+        def counting_parse(self, *args, **kwargs):
+            calls.append(1)
+            return original_parse(self, *args, **kwargs)
+
+        monkeypatch.setattr(Graph, "parse", counting_parse)
+        parse_ttl_with_result(simple_ttl)
+        parse_ttl_with_result(simple_ttl)
+        assert len(calls) == 2
+
+    def test_conversion_cache_bounded_by_content_size(self, simple_ttl):
+        """Test that the cache evicts by total content length"""
+        cache = ConversionCache(max_chars=len(simple_ttl) + 10)
+        other_ttl = simple_ttl + "\n# other\n"
+
+        parse_ttl_content(simple_ttl, cache=cache)
+        assert len(cache) == 1
+        parse_ttl_content(other_ttl, cache=cache)
+        assert len(cache) == 1
+
+        shared = ConversionCache(copy_results=False)
+        first = parse_ttl_content(simple_ttl, cache=shared)
+        assert parse_ttl_content(simple_ttl, cache=shared)[0] is first[0]
+
+
 class TestErrorHandling:
     """Test error handling and edge cases"""
     
@@ -814,7 +1295,23 @@ class TestFabricDefinitionValidator:
         assert len(errors) == 1
         assert errors[0].level == "warning"
         assert "String or BigInt" in errors[0].message
-    
+
+    def test_duplicate_property_ids_use_first_match(self):
+        """Test property lookups resolve duplicate ids to the first property"""
+        first = EntityTypeProperty(id="prop1", name="code", valueType="String")
+        duplicate = EntityTypeProperty(id="prop1", name="amount", valueType="Double")
+        entity = EntityType(
+            id="entity1",
+            name="Item",
+            properties=[first, duplicate],
+            entityIdParts=["prop1"],
+            displayNamePropertyId="prop1"
+        )
+
+        errors = FabricDefinitionValidator.validate_entity_types([entity])
+
+        assert errors == []
+
     def test_invalid_relationship_source(self):
         """Test validation catches invalid relationship source"""
         entity = EntityType(id="entity1", name="Person")
@@ -862,7 +1359,49 @@ class TestFabricDefinitionValidator:
         assert len(errors) == 1
         assert errors[0].level == "warning"
         assert "self-referential" in errors[0].message
-    
+
+    def test_relationships_without_entity_types_report_each_endpoint(self):
+        """Test that an empty entity list still yields per-relationship errors"""
+        rels = [
+            RelationshipType(
+                id=f"rel{i}",
+                name=f"rel{i}",
+                source=RelationshipEnd(entityTypeId="a"),
+                target=RelationshipEnd(entityTypeId="b"),
+            )
+            for i in range(3)
+        ]
+
+        errors = FabricDefinitionValidator.validate_relationships(rels, [])
+
+        assert len(errors) == 6
+        assert all(e.level == "error" for e in errors)
+        assert [e.entity_id for e in errors] == ["rel0", "rel0", "rel1", "rel1", "rel2", "rel2"]
+        assert FabricDefinitionValidator.validate_relationships([], []) == []
+
+    def test_repeated_id_part_reported_once(self):
+        """Test that a repeated entityIdParts entry yields a single issue"""
+        entity = EntityType(id="e1", name="Tag", entityIdParts=["nope", "nope"])
+
+        errors = FabricDefinitionValidator.validate_entity_types([entity])
+
+        assert len(errors) == 1
+        assert "'nope' not found" in errors[0].message
+
+    def test_validate_definition_fail_fast(self):
+        """Test that fail_fast returns only the first error"""
+        entities = [
+            EntityType(id="e1", name="First", baseEntityTypeId="missing1"),
+            EntityType(id="e2", name="Second", baseEntityTypeId="missing2"),
+        ]
+
+        is_valid, errors = FabricDefinitionValidator.validate_definition(entities, [], fail_fast=True)
+        assert not is_valid
+        assert len(errors) == 1
+        assert "missing1" in errors[0].message
+
+        assert FabricDefinitionValidator.validate_definition(entities[:0], [], fail_fast=True) == (True, [])
+
     def test_convert_to_fabric_definition_with_validation_error(self):
         """Test convert_to_fabric_definition raises error on invalid definition"""
         entity = EntityType(
@@ -876,7 +1415,22 @@ class TestFabricDefinitionValidator:
         
         assert "Invalid ontology definition" in str(excinfo.value)
         assert "non-existent parent" in str(excinfo.value)
-    
+
+    def test_validation_errors_independent_of_log_level(self, caplog):
+        """Test that the raised error lists every issue at any log level"""
+        import logging
+
+        entities = [
+            EntityType(id="entity1", name="First", baseEntityTypeId="missing1"),
+            EntityType(id="entity2", name="Second", baseEntityTypeId="missing2"),
+        ]
+
+        with caplog.at_level(logging.ERROR, logger="src.formats.rdf.rdf_converter"):
+            with pytest.raises(ValueError) as excinfo:
+                convert_to_fabric_definition(entities, [], "TestOntology")
+        assert "missing1" in str(excinfo.value)
+        assert "missing2" in str(excinfo.value)
+
     def test_convert_to_fabric_definition_with_warnings_passes(self):
         """Test convert_to_fabric_definition succeeds with only warnings"""
         entity = EntityType(id="entity1", name="Person")
@@ -893,6 +1447,37 @@ class TestFabricDefinitionValidator:
         assert "parts" in definition
         assert len(definition["parts"]) > 0
     
+    def test_convert_to_fabric_definition_stream_matches_parts(self):
+        """Test that streamed JSON lines match the in-memory parts array"""
+        import io
+        from src.rdf import convert_to_fabric_definition_stream
+
+        parent = EntityType(id="entity1", name="Person")
+        child = EntityType(id="entity2", name="Employee", baseEntityTypeId="entity1")
+        rel = RelationshipType(
+            id="rel1",
+            name="manages",
+            source=RelationshipEnd(entityTypeId="entity2"),
+            target=RelationshipEnd(entityTypeId="entity1")
+        )
+
+        sink = io.BytesIO()
+        written = convert_to_fabric_definition_stream([child, parent], [rel], "TestOntology", sink)
+        lines = sink.getvalue().splitlines()
+        expected = convert_to_fabric_definition([child, parent], [rel], "TestOntology")
+
+        assert written == len(lines) == len(expected["parts"])
+        assert [json.loads(line) for line in lines] == expected["parts"]
+
+    def test_definition_as_bytes(self, simple_ttl):
+        """Test that as_bytes returns the JSON encoding of the definition"""
+        definition, name = parse_ttl_content(simple_ttl)
+        encoded, encoded_name = parse_ttl_content(simple_ttl, as_bytes=True)
+
+        assert isinstance(encoded, bytes)
+        assert encoded_name == name
+        assert json.loads(encoded) == definition
+
     def test_definition_validation_error_str(self):
         """Test DefinitionValidationError string representation"""
         error = DefinitionValidationError(
@@ -1096,7 +1681,26 @@ class TestBlankNodeHandling:
         assert "http://example.org/Class2" in targets
         # Should not contain duplicates from looping
         assert targets.count("http://example.org/Class1") == 1
-    
+
+    def test_resolve_long_rdf_list_does_not_mutate_visited(self, converter):
+        """Test long RDF lists resolve fully without touching the caller's visited set"""
+        from rdflib import Graph, BNode, URIRef
+        from rdflib.namespace import RDF
+
+        graph = Graph()
+        classes = [URIRef(f"http://example.org/Class{i}") for i in range(500)]
+        cells = [BNode() for _ in classes]
+        for i, (cell, cls) in enumerate(zip(cells, classes)):
+            graph.add((cell, RDF.first, cls))
+            graph.add((cell, RDF.rest, cells[i + 1] if i + 1 < len(cells) else RDF.nil))
+
+        visited = set()
+        targets, unresolved = converter._resolve_rdf_list(graph, cells[0], visited, 10)
+
+        assert targets == [str(c) for c in classes]
+        assert unresolved == 0
+        assert visited == set()
+
     def test_object_property_with_unionof_range(self, converter):
         """Test object property with unionOf range creates correct relationships"""
         ttl = """
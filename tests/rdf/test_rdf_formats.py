@@ -81,6 +81,33 @@ class TestRDFFormatSupport:
         with pytest.raises(ValueError, match="Unsupported RDF serialization format"):
             RDFGraphParser.resolve_format("invalid_format")
 
+    def test_content_size_matches_utf8_length(self):
+        """Test that content size is the UTF-8 byte length for str and bytes."""
+        mb = 1024 * 1024
+        ascii_text = "@prefix ex: <http://example.org/> ."
+        unicode_text = 'ex:a rdfs:label "Café – 数据" .'
+        assert RDFGraphParser._content_size_mb(ascii_text) * mb == len(ascii_text)
+        assert RDFGraphParser._content_size_mb(unicode_text) * mb == len(unicode_text.encode("utf-8"))
+        assert RDFGraphParser._content_size_mb(unicode_text.encode("utf-8")) * mb == len(unicode_text.encode("utf-8"))
+
+    def test_native_store_is_opt_in(self):
+        """Test that graphs use rdflib's in-memory store by default."""
+        from rdflib.plugins.stores.memory import Memory
+
+        assert RDFGraphParser.use_native_store is False
+        assert isinstance(RDFGraphParser._create_graph("turtle").store, Memory)
+        assert isinstance(RDFGraphParser._create_graph("trig").store, Memory)
+
+    def test_native_store_never_used_for_formula_formats(self, monkeypatch):
+        """Test that N3 and TriG keep the formula-aware in-memory store."""
+        from src.formats.rdf import rdf_parser
+
+        monkeypatch.setattr(rdf_parser, "OXRDFLIB_AVAILABLE", True)
+        monkeypatch.setattr(RDFGraphParser, "use_native_store", True)
+        assert RDFGraphParser._native_store_enabled("turtle") is True
+        assert RDFGraphParser._native_store_enabled("n3") is False
+        assert RDFGraphParser._native_store_enabled("trig") is False
+
     # =========================================================================
     # Turtle Format Tests (.ttl)
     # =========================================================================